@@ -10,14 +10,17 @@ Usage::
 
 from __future__ import annotations
 
-import json
 import sys
 from pathlib import Path
 from typing import Annotated
 
 import cyclopts
 
-from axm_audit.formatters import format_agent, format_json, format_report
+from axm_audit.formatters import (
+    format_agent_bytes,
+    format_json_bytes,
+    format_report,
+)
 
 __all__ = ["app"]
 
@@ -57,10 +60,14 @@ def audit(
 
     result = audit_project(project_path, category=category)
 
-    if agent:
-        print(json.dumps(format_agent(result), indent=2))
-    elif json_output:
-        print(json.dumps(format_json(result), indent=2))
+    if agent or json_output:
+        encode = format_agent_bytes if agent else format_json_bytes
+        data = encode(result, indent=2)
+        if hasattr(sys.stdout, "buffer"):
+            sys.stdout.flush()
+            sys.stdout.buffer.write(data + b"\n")
+        else:  # text-only stream, e.g. redirect_stdout(StringIO())
+            print(data.decode())
     else:
         print(format_report(result))
 
@@ -1,5 +1,5 @@
 """Core audit functionality."""
 
-from axm_audit.core.auditor import audit_project, get_rules_for_category
+from axm_audit.core.auditor import audit_project, get_rules_for_category, run_rules
 
-__all__ = ["audit_project", "get_rules_for_category"]
+__all__ = ["audit_project", "get_rules_for_category", "run_rules"]
@@ -28,6 +28,7 @@ from axm_audit.core.rules import (
 )
 from axm_audit.core.rules.base import ProjectRule
 from axm_audit.models.results import AuditResult, CheckResult, Severity
+from axm_audit.utils import clear_audit_caches
 
 logger = logging.getLogger(__name__)
 
@@ -139,6 +140,34 @@ def _safe_check(rule: ProjectRule, project_path: Path) -> CheckResult:
         )
 
 
+def run_rules(
+    rules: list[ProjectRule],
+    project_path: Path,
+    max_workers: int | None = None,
+) -> list[CheckResult]:
+    """Run rules concurrently against a project.
+
+    Rules are I/O-bound (subprocesses, file reads) and share no state,
+    so they run on a thread pool; wall-clock time tends towards the
+    slowest rule rather than the sum. Results keep the order of ``rules``
+    and each rule is isolated via ``_safe_check``. Per-audit caches are
+    dropped with ``clear_audit_caches`` once the run finishes.
+
+    Args:
+        rules: Rule instances to execute.
+        project_path: Root directory of the project to audit.
+        max_workers: Thread pool size (executor default if None).
+
+    Returns:
+        One CheckResult per rule, in input order.
+    """
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(lambda r: _safe_check(r, project_path), rules))
+    finally:
+        clear_audit_caches()
+
+
 def audit_project(
     project_path: Path,
     category: str | None = None,
@@ -164,8 +193,4 @@ def audit_project(
         raise FileNotFoundError(f"Project path does not exist: {project_path}")
 
     rules = get_rules_for_category(category, quick)
-
-    with concurrent.futures.ThreadPoolExecutor() as pool:
-        checks = list(pool.map(lambda r: _safe_check(r, project_path), rules))
-
-    return AuditResult(checks=checks)
+    return AuditResult.from_checks(run_rules(rules, project_path))
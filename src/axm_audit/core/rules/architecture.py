@@ -1,6 +1,8 @@
 """Architecture rules — AST-based structural analysis."""
 
 import ast
+import functools
+import os
 from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
@@ -8,21 +10,61 @@ from typing import Any
 
 from axm_audit.core.rules.base import ProjectRule
 from axm_audit.models.results import CheckResult, Severity
+from axm_audit.utils import audit_cache
+
+# Directories never holding audited sources; pruned during the walk
+_SKIP_DIRS = frozenset({".git", ".hg", ".venv", "__pycache__", "node_modules"})
 
 
 def _get_python_files(directory: Path) -> list[Path]:
-    """Get all Python files in a directory recursively."""
-    if not directory.exists():
+    """Get all Python files in a directory recursively.
+
+    Walks with ``os.scandir``, whose entries carry their file type, so no
+    extra ``stat`` is needed per file. Symlinked directories, VCS and
+    virtualenv directories (``_SKIP_DIRS``) and unreadable directories are
+    skipped.
+    """
+    if not directory.is_dir():
         return []
-    return list(directory.rglob("*.py"))
+    files: list[Path] = []
+    stack = [os.fspath(directory)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _SKIP_DIRS:
+                        stack.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    files.append(Path(entry.path))
+    return files
+
+
+@audit_cache
+@functools.lru_cache(maxsize=512)
+def _parse_source(source: str, filename: str) -> ast.Module | None:
+    """Parse source code, returning None on syntax error.
+
+    Memoized on the content: several AST rules walk the same files in one
+    audit, so each unique file is parsed once. Trees are shared between
+    rules and must not be mutated.
+    """
+    try:
+        return ast.parse(source, filename=filename)
+    except SyntaxError:
+        return None
 
 
 def _parse_file_safe(path: Path) -> ast.Module | None:
     """Parse a Python file, returning None on error."""
     try:
-        return ast.parse(path.read_text(), filename=str(path))
-    except (SyntaxError, UnicodeDecodeError):
+        source = path.read_text()
+    except UnicodeDecodeError:
         return None
+    return _parse_source(source, str(path))
 
 
 def _get_module_name(path: Path, src_root: Path) -> str:
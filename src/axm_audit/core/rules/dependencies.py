@@ -92,7 +92,7 @@ def _run_deptry(project_path: Path) -> list[dict[str, Any]]:
 
     try:
         run_in_project(
-            ["deptry", ".", "--json-output", str(tmp_path)],
+            ["deptry", ".", "--json-output", tmp_path],
             project_path,
             capture_output=True,
             text=True,
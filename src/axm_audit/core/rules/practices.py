@@ -1,6 +1,7 @@
 """Practice rules — code quality patterns via AST and regex."""
 
 import ast
+import functools
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -161,18 +162,27 @@ class BareExceptRule(ProjectRule):
         )
 
 
+_SECRET_PATTERNS = (
+    r"password\s*=\s*[\"'][^\"']+[\"']",
+    r"secret\s*=\s*[\"'][^\"']+[\"']",
+    r"api_key\s*=\s*[\"'][^\"']+[\"']",
+    r"token\s*=\s*[\"'][^\"']+[\"']",
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_secret_patterns(
+    patterns: tuple[str, ...],
+) -> tuple[tuple[re.Pattern[str], str], ...]:
+    """Compile secret patterns once, each paired with its reported key name."""
+    return tuple((re.compile(p, re.IGNORECASE), p.split(r"\s*")[0]) for p in patterns)
+
+
 @dataclass
 class SecurityPatternRule(ProjectRule):
     """Detect hardcoded secrets via regex patterns."""
 
-    patterns: list[str] = field(
-        default_factory=lambda: [
-            r"password\s*=\s*[\"'][^\"']+[\"']",
-            r"secret\s*=\s*[\"'][^\"']+[\"']",
-            r"api_key\s*=\s*[\"'][^\"']+[\"']",
-            r"token\s*=\s*[\"'][^\"']+[\"']",
-        ]
-    )
+    patterns: list[str] = field(default_factory=lambda: list(_SECRET_PATTERNS))
 
     @property
     def rule_id(self) -> str:
@@ -193,6 +203,7 @@ class SecurityPatternRule(ProjectRule):
 
         matches: list[dict[str, str | int]] = []
         py_files = _get_python_files(src_path)
+        compiled = _compile_secret_patterns(tuple(self.patterns))
 
         for path in py_files:
             try:
@@ -200,15 +211,15 @@ class SecurityPatternRule(ProjectRule):
             except (OSError, UnicodeDecodeError):
                 continue
 
-            for pattern in self.patterns:
-                for match in re.finditer(pattern, content, re.IGNORECASE):
+            for regex, key_name in compiled:
+                for match in regex.finditer(content):
                     # Find line number
                     line_num = content[: match.start()].count("\n") + 1
                     matches.append(
                         {
                             "file": str(path.relative_to(src_path)),
                             "line": line_num,
-                            "pattern": pattern.split(r"\s*")[0],  # Just the key name
+                            "pattern": key_name,
                         }
                     )
 
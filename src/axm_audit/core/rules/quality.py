@@ -1,13 +1,34 @@
 """Quality rules — subprocess-based tool execution with JSON parsing."""
 
 import json
+import re
 from dataclasses import dataclass
 from pathlib import Path
 
+from pydantic_core import from_json
+
 from axm_audit.core.rules.base import ProjectRule
 from axm_audit.core.runner import run_in_project
 from axm_audit.models.results import CheckResult, Severity
 
+# pytest summary line: "FAILED tests/test_foo.py::test_bar - msg"
+_FAILED_RE = re.compile(r"^FAILED (.*?)(?: - (.*))?$", re.MULTILINE)
+
+
+def _lint_score(issue_count: int) -> int:
+    """Score ruff findings: 2 points per issue, min 0."""
+    return max(0, 100 - issue_count * 2)
+
+
+def _type_score(error_count: int) -> int:
+    """Score mypy errors: 5 points per error, min 0."""
+    return max(0, 100 - error_count * 5)
+
+
+def _complexity_score(high_complexity_count: int) -> int:
+    """Score complexity: 10 points per function with CC >= 10, min 0."""
+    return max(0, 100 - high_complexity_count * 10)
+
 
 @dataclass
 class LintingRule(ProjectRule):
@@ -34,25 +55,25 @@ class LintingRule(ProjectRule):
                 severity=Severity.ERROR,
             )
 
-        targets = [str(src_path)]
+        targets = [src_path]
         if tests_path.exists():
-            targets.append(str(tests_path))
+            targets.append(tests_path)
 
+        # Keep stdout as bytes: from_json parses them without a decode pass
         result = run_in_project(
             ["ruff", "check", "--output-format=json", *targets],
             project_path,
             capture_output=True,
-            text=True,
             check=False,
         )
 
         try:
-            issues = json.loads(result.stdout) if result.stdout.strip() else []
-        except json.JSONDecodeError:
+            issues = from_json(result.stdout) if result.stdout.strip() else []
+        except ValueError:
             issues = []
 
         issue_count = len(issues)
-        score = max(0, 100 - issue_count * 2)
+        score = _lint_score(issue_count)
         passed = score >= 80
 
         # Store individual violations (capped at 20) for agent mode
@@ -77,6 +98,7 @@ class LintingRule(ProjectRule):
                 "score": score,
                 "checked": checked,
                 "issues": formatted_issues,
+                "issues_shown": len(formatted_issues),
             },
             fix_hint=f"Run: ruff check --fix {checked}" if issue_count > 0 else None,
         )
@@ -107,9 +129,9 @@ class FormattingRule(ProjectRule):
                 severity=Severity.ERROR,
             )
 
-        targets = [str(src_path)]
+        targets = [src_path]
         if tests_path.exists():
-            targets.append(str(tests_path))
+            targets.append(tests_path)
 
         result = run_in_project(
             ["ruff", "format", "--check", *targets],
@@ -171,25 +193,24 @@ class TypeCheckRule(ProjectRule):
                 severity=Severity.ERROR,
             )
 
-        targets = [str(src_path)]
+        targets = [src_path]
         if tests_path.exists():
-            targets.append(str(tests_path))
+            targets.append(tests_path)
 
         result = run_in_project(
             ["mypy", "--no-error-summary", "--output", "json", *targets],
             project_path,
             capture_output=True,
-            text=True,
             check=False,
         )
 
         error_count = 0
         errors: list[dict[str, str | int]] = []
         if result.stdout.strip():
-            for line in result.stdout.strip().split("\n"):
+            for line in result.stdout.splitlines():
                 if line.strip():
                     try:
-                        entry = json.loads(line)
+                        entry = from_json(line)
                         if entry.get("severity") == "error":
                             error_count += 1
                             errors.append(
@@ -200,10 +221,10 @@ class TypeCheckRule(ProjectRule):
                                     "code": entry.get("code", ""),
                                 }
                             )
-                    except json.JSONDecodeError:
+                    except ValueError:
                         pass
 
-        score = max(0, 100 - error_count * 5)
+        score = _type_score(error_count)
         passed = score >= 80
 
         checked = "src/ tests/" if tests_path.exists() else "src/"
@@ -289,7 +310,7 @@ class ComplexityRule(ProjectRule):
         # Sort by complexity descending, take top 5
         top_offenders = sorted(all_functions, key=lambda x: x["cc"], reverse=True)[:5]
 
-        score = max(0, 100 - high_complexity_count * 10)
+        score = _complexity_score(high_complexity_count)
         passed = score >= 80
 
         return CheckResult(
@@ -408,18 +429,12 @@ def _extract_test_failures(stdout: str) -> list[dict[str, str]]:
     Returns:
         List of dicts with 'test' and 'traceback' keys.
     """
-    failures: list[dict[str, str]] = []
+    failures = [
+        {"test": m[1].strip(), "traceback": (m[2] or "").strip()}
+        for m in _FAILED_RE.finditer(stdout)
+    ]
     lines = stdout.split("\n")
 
-    # Collect FAILED lines: "FAILED tests/test_foo.py::test_bar - msg"
-    for line in lines:
-        if line.startswith("FAILED "):
-            # Extract test name (before the " - " separator)
-            parts = line[7:].split(" - ", 1)
-            test_name = parts[0].strip()
-            error_msg = parts[1].strip() if len(parts) > 1 else ""
-            failures.append({"test": test_name, "traceback": error_msg})
-
     # If short traceback blocks exist, try to attach them
     # Format: "___ test_name ___" followed by traceback lines
     current_test: str | None = None
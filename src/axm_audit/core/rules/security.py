@@ -13,7 +13,7 @@ from axm_audit.models.results import CheckResult, Severity
 def _run_bandit(src_path: Path, project_path: Path) -> dict[str, Any]:
     """Run Bandit and return parsed JSON output."""
     result = run_in_project(
-        ["bandit", "-r", "-f", "json", str(src_path)],
+        ["bandit", "-r", "-f", "json", src_path],
         project_path,
         capture_output=True,
         check=False,
@@ -25,6 +25,11 @@ def _run_bandit(src_path: Path, project_path: Path) -> dict[str, Any]:
         return {}
 
 
+def _security_score(high: int, med: int) -> int:
+    """Score Bandit findings: 15 points per HIGH, 5 per MEDIUM, min 0."""
+    return max(0, 100 - (high * 15 + med * 5))
+
+
 def _extract_top_issues(results: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Extract top 5 issues sorted by severity (HIGH first)."""
     sorted_issues = sorted(
@@ -73,7 +78,7 @@ class SecurityRule(ProjectRule):
         results = data.get("results", [])
         high = sum(1 for r in results if r.get("issue_severity") == "HIGH")
         med = sum(1 for r in results if r.get("issue_severity") == "MEDIUM")
-        score = max(0, 100 - (high * 15 + med * 5))
+        score = _security_score(high, med)
 
         return CheckResult(
             rule_id=self.rule_id,
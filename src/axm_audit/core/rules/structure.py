@@ -64,14 +64,17 @@ class DirectoryExistsRule(ProjectRule):
 
 
 # Fields to check in pyproject.toml [project] section
-_REQUIRED_FIELDS = ("name", "description", "requires-python", "license", "authors")
-_OPTIONAL_FIELDS = ("classifiers", "readme")
+_REQUIRED_FIELDS = frozenset(
+    ("name", "description", "requires-python", "license", "authors")
+)
+_OPTIONAL_FIELDS = frozenset(("classifiers", "readme"))
 _TOTAL_FIELDS = 9  # required(5) + version + urls + optional(2)
 
 
 def _count_fields(project: dict[str, Any]) -> int:
     """Count present PEP 621 fields in project table."""
-    present = sum(1 for f in _REQUIRED_FIELDS if f in project)
+    keys = project.keys()
+    present = len(_REQUIRED_FIELDS & keys)
 
     # Version: static or dynamic
     if "version" in project or "version" in project.get("dynamic", []):
@@ -82,7 +85,7 @@ def _count_fields(project: dict[str, Any]) -> int:
         present += 1
 
     # Optional fields
-    present += sum(1 for f in _OPTIONAL_FIELDS if f in project)
+    present += len(_OPTIONAL_FIELDS & keys)
     return present
 
 
@@ -114,8 +117,9 @@ class PyprojectCompletenessRule(ProjectRule):
             )
 
         try:
-            data = tomllib.loads(pyproject_path.read_text())
-        except (tomllib.TOMLDecodeError, OSError):
+            with pyproject_path.open("rb") as fh:
+                data = tomllib.load(fh)
+        except (tomllib.TOMLDecodeError, UnicodeDecodeError, OSError):
             return CheckResult(
                 rule_id=self.rule_id,
                 passed=False,
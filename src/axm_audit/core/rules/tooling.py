@@ -1,11 +1,20 @@
 """Tooling rules — CLI tool availability checks."""
 
+import functools
 import shutil
 from dataclasses import dataclass
 from pathlib import Path
 
 from axm_audit.core.rules.base import ProjectRule
 from axm_audit.models.results import CheckResult, Severity
+from axm_audit.utils import audit_cache
+
+
+@audit_cache
+@functools.lru_cache(maxsize=32)
+def _which(tool_name: str) -> str | None:
+    """Resolve a tool on PATH, scanning it once per tool per audit."""
+    return shutil.which(tool_name)
 
 
 @dataclass
@@ -23,7 +32,7 @@ class ToolAvailabilityRule(ProjectRule):
     def check(self, project_path: Path) -> CheckResult:
         """Check if the tool is available on the system PATH."""
         _ = project_path  # Not used for tool availability checks
-        available = shutil.which(self.tool_name) is not None
+        available = _which(self.tool_name) is not None
 
         if available:
             return CheckResult(
@@ -6,16 +6,32 @@ execute in *that* project's virtual environment, not axm-audit's own.
 
 from __future__ import annotations
 
+import functools
+import os
 import subprocess
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any
 
+from axm_audit.utils import audit_cache
+
+
+@audit_cache
+@functools.lru_cache(maxsize=16)
+def _has_venv(project_path: Path) -> bool:
+    """Return True if the project has a `.venv/` interpreter.
+
+    Cached per project path: an audit launches many tools against the
+    same project, so the venv is looked up once instead of once per tool.
+    """
+    return (project_path / ".venv" / "bin" / "python").exists()
+
 
 def run_in_project(
-    cmd: list[str],
+    cmd: Sequence[str | os.PathLike[str]],
     project_path: Path,
     **kwargs: Any,
-) -> subprocess.CompletedProcess[str]:
+) -> subprocess.CompletedProcess[Any]:
     """Run a command in the target project's environment.
 
     If the project has a `.venv/`, uses `uv run --directory` to execute
@@ -23,19 +39,20 @@ def run_in_project(
     command directly with `cwd` set to the project path.
 
     Args:
-        cmd: Command and arguments to run.
+        cmd: Command and arguments to run; path arguments may be passed
+            as ``Path`` objects, subprocess converts them itself.
         project_path: Root of the project being audited.
         **kwargs: Extra arguments forwarded to subprocess.run.
 
     Returns:
-        CompletedProcess result.
+        CompletedProcess result; ``stdout``/``stderr`` are ``str`` only
+        when ``text=True`` is passed, ``bytes`` otherwise.
     """
-    venv_python = project_path / ".venv" / "bin" / "python"
-
-    if venv_python.exists():
-        full_cmd = ["uv", "run", "--directory", str(project_path), *cmd]
+    full_cmd: list[str | os.PathLike[str]]
+    if _has_venv(project_path):
+        full_cmd = ["uv", "run", "--directory", project_path, *cmd]
     else:
-        full_cmd = cmd
-        kwargs.setdefault("cwd", str(project_path))
+        full_cmd = list(cmd)
+        kwargs.setdefault("cwd", project_path)
 
     return subprocess.run(full_cmd, **kwargs)  # noqa: S603
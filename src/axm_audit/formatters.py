@@ -5,9 +5,20 @@ from __future__ import annotations
 from typing import Any
 
 from axm_audit.models.results import AuditResult, CheckResult
+from axm_audit.utils import encode_json
 
 _GRADE_EMOJI = {"A": "🏆", "B": "✅", "C": "⚠️", "D": "🔧", "F": "❌"}
 
+# rule_id prefix (text before the first "_") → display category
+_CATEGORY_BY_PREFIX = {
+    "QUALITY": "quality",
+    "DEPS": "dependencies",
+    "PRACTICE": "practices",
+    "ARCH": "architecture",
+    "TOOL": "tooling",
+    "STRUCTURE": "structure",
+}
+
 # ── Detail formatters (per rule type) ────────────────────────────────
 
 _INDENT = "     "
@@ -219,6 +230,11 @@ def format_json(result: AuditResult) -> dict[str, Any]:
     }
 
 
+def format_json_bytes(result: AuditResult, *, indent: int | None = None) -> bytes:
+    """Serialize ``format_json`` output straight to UTF-8 JSON bytes."""
+    return encode_json(format_json(result), indent=indent)
+
+
 def format_agent(result: AuditResult) -> dict[str, Any]:
     """Agent-optimized output: passed=summary, failed=full detail.
 
@@ -259,6 +275,11 @@ def format_agent(result: AuditResult) -> dict[str, Any]:
     }
 
 
+def format_agent_bytes(result: AuditResult, *, indent: int | None = None) -> bytes:
+    """Serialize ``format_agent`` output straight to UTF-8 JSON bytes."""
+    return encode_json(format_agent(result), indent=indent)
+
+
 def _has_actionable_detail(check: CheckResult) -> bool:
     """Return True if a passing check has items the agent should act on."""
     if not check.details:
@@ -272,15 +293,4 @@ def _has_actionable_detail(check: CheckResult) -> bool:
 
 def _category_for(rule_id: str) -> str:
     """Map a rule_id to its display category."""
-    prefixes = {
-        "QUALITY_": "quality",
-        "DEPS_": "dependencies",
-        "PRACTICE_": "practices",
-        "ARCH_": "architecture",
-        "TOOL_": "tooling",
-        "STRUCTURE_": "structure",
-    }
-    for prefix, category in prefixes.items():
-        if rule_id.startswith(prefix):
-            return category
-    return "other"
+    return _CATEGORY_BY_PREFIX.get(rule_id.partition("_")[0], "other")
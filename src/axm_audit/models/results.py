@@ -1,9 +1,76 @@
 """Result models for Agent-friendly JSON output."""
 
+import sys
+from bisect import bisect_right
+from collections.abc import Iterable, Mapping
 from enum import StrEnum
-from typing import Any
+from typing import Any, Final, NamedTuple, Self
+
+from pydantic import BaseModel, Field, PrivateAttr, computed_field, field_validator
+
+# Scored categories and their weight in quality_score (sum to 1.0)
+_CATEGORY_WEIGHTS: Final[Mapping[str, float]] = {
+    "lint": 0.20,
+    "type": 0.15,
+    "complexity": 0.15,
+    "security": 0.10,
+    "deps": 0.10,
+    "testing": 0.15,
+    "architecture": 0.10,
+    "practices": 0.05,
+}
+
+# Map rule_id to scored category
+_RULE_TO_CATEGORY: Final[Mapping[str, str]] = {
+    "QUALITY_LINT": "lint",
+    "QUALITY_TYPE": "type",
+    "QUALITY_COMPLEXITY": "complexity",
+    "QUALITY_SECURITY": "security",
+    "DEPS_AUDIT": "deps",
+    "DEPS_HYGIENE": "deps",
+    "QUALITY_COVERAGE": "testing",
+    "ARCH_COUPLING": "architecture",
+    "ARCH_CIRCULAR": "architecture",
+    "ARCH_GOD_CLASS": "architecture",
+    "PRACTICE_DOCSTRING": "practices",
+    "PRACTICE_BARE_EXCEPT": "practices",
+    "PRACTICE_SECURITY": "practices",
+}
+
+# Lower bound of each grade above F; _GRADES[i] applies from threshold i-1
+_GRADE_THRESHOLDS: Final = (60, 70, 80, 90)
+_GRADES: Final = ("F", "D", "C", "B", "A")
+
+
+def _compute_quality_score(scores: Iterable[tuple[str, float]]) -> float | None:
+    """Weighted quality score from ``(rule_id, score)`` pairs.
+
+    Scores are averaged per category, then weighted; missing categories
+    contribute 0 and unscored rule ids are ignored. Returns None when no
+    pair maps to a scored category.
+    """
+    category_scores: dict[str, list[float]] = {}
+    for rule_id, score in scores:
+        cat = _RULE_TO_CATEGORY.get(rule_id)
+        if cat:
+            category_scores.setdefault(cat, []).append(float(score))
+
+    if not category_scores:
+        return None
+
+    # Sum in the fixed weight order so the rounded score does not depend
+    # on check order (float addition is not associative).
+    total = 0.0
+    for cat, weight in _CATEGORY_WEIGHTS.items():
+        cat_scores = category_scores.get(cat)
+        if cat_scores:
+            total += (sum(cat_scores) / len(cat_scores)) * weight
+    return round(total, 1)
+
 
-from pydantic import BaseModel, Field, computed_field
+def _grade_for(score: float) -> str:
+    """Letter grade for a quality score (A >= 90 ... F < 60)."""
+    return _GRADES[bisect_right(_GRADE_THRESHOLDS, score)]
 
 
 class Severity(StrEnum):
@@ -17,7 +84,8 @@ class Severity(StrEnum):
 class CheckResult(BaseModel):
     """Result of a single compliance check.
 
-    Designed for machine parsing by AI Agents.
+    Designed for machine parsing by AI Agents. Instances are immutable
+    once built by a rule.
     """
 
     rule_id: str = Field(..., description="Unique identifier for the rule")
@@ -29,22 +97,78 @@ class CheckResult(BaseModel):
     )
     fix_hint: str | None = Field(default=None, description="Actionable fix suggestion")
 
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
+
+    @field_validator("rule_id")
+    @classmethod
+    def _intern_rule_id(cls, value: str) -> str:
+        """Intern rule ids so per-check dict lookups hash and compare cheaply."""
+        return sys.intern(value)
+
+
+class _Summary(NamedTuple):
+    """Aggregates derived from a single pass over ``AuditResult.checks``."""
+
+    failed: int
+    blocking: int
+    quality_score: float | None
 
 
 class AuditResult(BaseModel):
     """Aggregated result of a project audit.
 
-    Contains all individual check results and computed summary.
+    Contains all individual check results and computed summary. The
+    model is frozen, so the summary is computed once at construction and
+    recomputed by ``model_copy`` for the copy's checks.
     """
 
-    checks: list[CheckResult] = Field(default_factory=list)
+    checks: tuple[CheckResult, ...] = Field(default=())
+
+    _summary: _Summary = PrivateAttr()
+
+    @classmethod
+    def from_checks(cls, checks: Iterable[CheckResult]) -> "AuditResult":
+        """Build a result from rule output without re-running validation.
+
+        For internal use where every item is already a ``CheckResult``
+        (e.g. the auditor collecting rule results); element types are
+        not checked.
+        """
+        return cls.model_construct(checks=tuple(checks))
+
+    def model_post_init(self, context: Any, /) -> None:
+        """Derive the summary once the checks are set."""
+        self._summary = self._compute_summary()
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        """Copy the result, recomputing the summary for the copied checks."""
+        copy = super().model_copy(update=update, deep=deep)
+        copy._summary = copy._compute_summary()
+        return copy
+
+    def _compute_summary(self) -> _Summary:
+        """Count failures and collect rule scores in one pass."""
+        failed = blocking = 0
+        scores: list[tuple[str, float]] = []
+        for check in self.checks:
+            if not check.passed:
+                failed += 1
+                if check.severity is Severity.ERROR:
+                    blocking += 1
+            if check.details:
+                score = check.details.get("score")
+                if score is not None:
+                    scores.append((check.rule_id, score))
+
+        return _Summary(failed, blocking, _compute_quality_score(scores))
 
     @computed_field  # type: ignore[prop-decorator]
     @property
     def success(self) -> bool:
         """True if all checks passed."""
-        return all(c.passed for c in self.checks)
+        return self._summary.failed == 0
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -56,7 +180,13 @@ class AuditResult(BaseModel):
     @property
     def failed(self) -> int:
         """Number of failed checks."""
-        return sum(1 for c in self.checks if not c.passed)
+        return self._summary.failed
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def blocking_failures(self) -> int:
+        """Number of failed checks with ERROR severity."""
+        return self._summary.blocking
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -71,55 +201,7 @@ class AuditResult(BaseModel):
         Structure is NOT scored here (handled by axm-init).
         Returns None if no scored checks are present.
         """
-        category_weights = {
-            "lint": 0.20,
-            "type": 0.15,
-            "complexity": 0.15,
-            "security": 0.10,
-            "deps": 0.10,
-            "testing": 0.15,
-            "architecture": 0.10,
-            "practices": 0.05,
-        }
-
-        # Map rule_id prefixes to categories
-        rule_to_category: dict[str, str] = {
-            "QUALITY_LINT": "lint",
-            "QUALITY_TYPE": "type",
-            "QUALITY_COMPLEXITY": "complexity",
-            "QUALITY_SECURITY": "security",
-            "DEPS_AUDIT": "deps",
-            "DEPS_HYGIENE": "deps",
-            "QUALITY_COVERAGE": "testing",
-            "ARCH_COUPLING": "architecture",
-            "ARCH_CIRCULAR": "architecture",
-            "ARCH_GOD_CLASS": "architecture",
-            "PRACTICE_DOCSTRING": "practices",
-            "PRACTICE_BARE_EXCEPT": "practices",
-            "PRACTICE_SECURITY": "practices",
-        }
-
-        # Collect scores by category
-        category_scores: dict[str, list[float]] = {}
-        for check in self.checks:
-            cat = rule_to_category.get(check.rule_id)
-            if cat and check.details:
-                score = check.details.get("score")
-                if score is not None:
-                    category_scores.setdefault(cat, []).append(float(score))
-
-        if not category_scores:
-            return None
-
-        # Weighted average: avg each category, then weight
-        total = 0.0
-        for cat, weight in category_weights.items():
-            scores = category_scores.get(cat, [])
-            if scores:
-                total += (sum(scores) / len(scores)) * weight
-            # Missing categories contribute 0
-
-        return round(total, 1)
+        return self._summary.quality_score
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -132,14 +214,6 @@ class AuditResult(BaseModel):
         score = self.quality_score
         if score is None:
             return None
-        if score >= 90:
-            return "A"
-        if score >= 80:
-            return "B"
-        if score >= 70:
-            return "C"
-        if score >= 60:
-            return "D"
-        return "F"
-
-    model_config = {"extra": "forbid"}
+        return _grade_for(score)
+
+    model_config = {"extra": "forbid", "frozen": True}
@@ -3,11 +3,33 @@
 Provides both JSON (for AI Agents) and Markdown (for reasoning) outputs.
 """
 
+import io
 from abc import ABC, abstractmethod
+from typing import Final
 
 from pydantic import BaseModel
 
-from axm_audit.models.results import AuditResult
+from axm_audit.models.results import AuditResult, CheckResult
+from axm_audit.utils import encode_json, load_orjson
+
+_OK_ICON: Final = "✅"
+_FAIL_ICON: Final = "❌"
+_HEADER_PASSED: Final = f"# Audit Report\n\n**Status:** {_OK_ICON} PASSED"
+_HEADER_FAILED: Final = f"# Audit Report\n\n**Status:** {_FAIL_ICON} FAILED"
+_TABLE_HEADER: Final = "| Rule ID | Status | Message |\n|---------|--------|---------|"
+# Keep messages on one table row: escape pipes, flatten line breaks
+_MD_CELL_ESCAPE: Final = str.maketrans({"|": r"\|", "\n": " ", "\r": ""})
+
+
+def _dump_json(result: BaseModel) -> str:
+    """Serialize a model to 2-space indented JSON.
+
+    Uses ``encode_json`` on a single JSON-mode dump when the ``fast``
+    extra is installed, otherwise pydantic's native ``model_dump_json``.
+    """
+    if load_orjson() is None:
+        return result.model_dump_json(indent=2)
+    return encode_json(result.model_dump(mode="json"), indent=2).decode()
 
 
 class Reporter(ABC):
@@ -26,7 +48,7 @@ class JsonReporter(Reporter):
 
     def render(self, result: BaseModel) -> str:
         """Render result as pure JSON string."""
-        return result.model_dump_json(indent=2)
+        return _dump_json(result)
 
 
 class MarkdownReporter(Reporter):
@@ -39,22 +61,35 @@ class MarkdownReporter(Reporter):
         """Render result as Markdown table."""
         if isinstance(result, AuditResult):
             return self._render_audit(result)
-        return result.model_dump_json(indent=2)
+        return _dump_json(result)
 
     def _render_audit(self, result: AuditResult) -> str:
         """Render AuditResult as markdown with grade."""
-        parts = [
-            self._render_header(result),
-            self._render_grade(result),
-            self._render_summary(result),
-            self._render_checks(result),
-            self._render_fix_hints(result),
-        ]
-        return "\n".join(part for part in parts if part)
+        buf = io.StringIO()
+        write = buf.write
+        write(self._render_header(result))
+        grade = self._render_grade(result)
+        if grade:
+            write(f"\n{grade}")
+        write(f"\n{self._render_summary(result)}\n{_TABLE_HEADER}")
+
+        # Table rows are streamed and fix hints collected in one pass
+        hints: list[CheckResult] = []
+        for check in result.checks:
+            icon = _OK_ICON if check.passed else _FAIL_ICON
+            message = check.message.translate(_MD_CELL_ESCAPE)
+            write(f"\n| {check.rule_id} | {icon} | {message} |")
+            if not check.passed and check.fix_hint:
+                hints.append(check)
+
+        if hints:
+            write("\n\n## Fix Hints")
+            for check in hints:
+                write(f"\n- **{check.rule_id}**: {check.fix_hint}")
+        return buf.getvalue()
 
     def _render_header(self, result: AuditResult) -> str:
-        status_icon = "✅ PASSED" if result.success else "❌ FAILED"
-        return f"# Audit Report\n\n**Status:** {status_icon}"
+        return _HEADER_PASSED if result.success else _HEADER_FAILED
 
     def _render_grade(self, result: AuditResult) -> str:
         if result.quality_score is not None and result.grade is not None:
@@ -67,23 +102,3 @@ class MarkdownReporter(Reporter):
             f"**Total:** {result.total} | **Passed:** {passed_count} "
             f"| **Failed:** {result.failed}\n"
         )
-
-    def _render_checks(self, result: AuditResult) -> str:
-        lines = [
-            "| Rule ID | Status | Message |",
-            "|---------|--------|---------|",
-        ]
-        for check in result.checks:
-            status = "✅" if check.passed else "❌"
-            lines.append(f"| {check.rule_id} | {status} | {check.message} |")
-        return "\n".join(lines)
-
-    def _render_fix_hints(self, result: AuditResult) -> str:
-        failed_with_hints = [c for c in result.checks if not c.passed and c.fix_hint]
-        if not failed_with_hints:
-            return ""
-
-        lines = ["", "## Fix Hints"]
-        for check in failed_with_hints:
-            lines.append(f"- **{check.rule_id}**: {check.fix_hint}")
-        return "\n".join(lines)
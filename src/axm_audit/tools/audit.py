@@ -7,6 +7,9 @@ from typing import Any
 
 from axm.tools.base import AXMTool, ToolResult
 
+from axm_audit.core.auditor import audit_project
+from axm_audit.formatters import format_agent
+
 __all__ = ["AuditTool"]
 
 
@@ -44,9 +47,6 @@ class AuditTool(AXMTool):
                     success=False, error=f"Not a directory: {project_path}"
                 )
 
-            from axm_audit.core.auditor import audit_project
-            from axm_audit.formatters import format_agent
-
             result = audit_project(project_path, category=category)
             return ToolResult(success=True, data=format_agent(result))
         except Exception as exc:
@@ -1 +1,66 @@
 """Utility functions."""
+
+from __future__ import annotations
+
+import functools
+import importlib
+from types import ModuleType
+from typing import Any, Protocol
+
+from pydantic_core import to_json, to_jsonable_python
+
+__all__ = ["audit_cache", "clear_audit_caches", "encode_json", "load_orjson"]
+
+
+class _Clearable(Protocol):
+    def cache_clear(self) -> None: ...
+
+
+_AUDIT_CACHES: list[_Clearable] = []
+
+
+def audit_cache[C: _Clearable](cache: C) -> C:
+    """Register a memoized function whose entries are only valid for one audit.
+
+    Apply it on top of ``functools.lru_cache``; ``clear_audit_caches``
+    then empties the cache together with every other registered one.
+    """
+    _AUDIT_CACHES.append(cache)
+    return cache
+
+
+def clear_audit_caches() -> None:
+    """Drop everything memoized for the current audit.
+
+    Rules memoize filesystem lookups (parsed sources, tools on PATH, the
+    project's venv) that go stale once the project or environment changes.
+    ``run_rules`` calls this when an audit ends; code that runs rules or
+    ``run_in_project`` directly should call it between audits.
+    """
+    for cache in _AUDIT_CACHES:
+        cache.cache_clear()
+
+
+@functools.cache
+def load_orjson() -> ModuleType | None:
+    """Return the optional ``orjson`` module, or None if not installed."""
+    try:
+        return importlib.import_module("orjson")
+    except ModuleNotFoundError:
+        return None
+
+
+def encode_json(payload: Any, *, indent: int | None = None) -> bytes:
+    """Encode a JSON-compatible payload to UTF-8 JSON bytes.
+
+    Uses ``orjson`` when the ``fast`` extra is installed and the indent is
+    one it supports (none or 2), otherwise pydantic-core's native
+    serializer. Both accept non-string dict keys and fall back to
+    pydantic's conversion for other non-JSON values.
+    """
+    orjson = load_orjson()
+    if orjson is None or indent not in (None, 2):
+        return to_json(payload, indent=indent)
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+    data: bytes = orjson.dumps(payload, default=to_jsonable_python, option=option)
+    return data
@@ -1,9 +1,93 @@
 """Shared pytest fixtures."""
 
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
 import pytest
 
+from axm_audit import get_rules_for_category
+from axm_audit.core.rules.base import ProjectRule
+from axm_audit.models import AuditResult, CheckResult
+from tests.helpers import FakeOrjson
+
 
 @pytest.fixture
 def sample_data() -> dict[str, str]:
     """Provide sample test data."""
     return {"key": "value"}
+
+
+@pytest.fixture(scope="session")
+def all_rules() -> list[ProjectRule]:
+    """Build the full rule registry once for the session."""
+    return get_rules_for_category(None)
+
+
+@pytest.fixture(scope="session")
+def all_rule_ids(all_rules: list[ProjectRule]) -> frozenset[str]:
+    """Registered rule ids, shared across tests."""
+    return frozenset(rule.rule_id for rule in all_rules)
+
+
+@pytest.fixture(scope="class")
+def rule(request: pytest.FixtureRequest) -> ProjectRule:
+    """Instantiate the test class's ``rule_class`` once per class."""
+    rule_class: type[ProjectRule] = request.cls.rule_class
+    return rule_class()
+
+
+@pytest.fixture
+def make_audit_result() -> Callable[..., AuditResult]:
+    """Build a fresh single-check AuditResult from the given fields."""
+
+    def _build(
+        rule_id: str = "R1",
+        passed: bool = True,
+        message: str = "OK",
+        score: float | None = None,
+    ) -> AuditResult:
+        details = {"score": score} if score is not None else None
+        check = CheckResult(
+            rule_id=rule_id, passed=passed, message=message, details=details
+        )
+        return AuditResult(checks=[check])
+
+    return _build
+
+
+@pytest.fixture(params=["orjson", "pydantic-core"])
+def json_backend(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> FakeOrjson | None:
+    """Run a test once with a fake ``orjson`` and once without it."""
+    backend = FakeOrjson() if request.param == "orjson" else None
+    for module in ("axm_audit.utils", "axm_audit.reporters.reporters"):
+        monkeypatch.setattr(f"{module}.load_orjson", lambda: backend)
+    return backend
+
+
+@pytest.fixture
+def minimal_project(tmp_path: Path) -> Path:
+    """Create a bare project (pyproject.toml + empty src/) in tmp_path.
+
+    Function-scoped on purpose: audits write tool caches and coverage
+    reports into the project, so each test gets its own tree.
+    """
+    (tmp_path / "pyproject.toml").write_text("[project]\nname='test'")
+    (tmp_path / "src").mkdir()
+    return tmp_path
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _shared_mypy_cache(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Iterator[None]:
+    """Point every mypy run in the session at one cache directory.
+
+    Tool rules run mypy inside fresh tmp_path projects, each of which
+    would otherwise rebuild the typeshed/stdlib cache from scratch.
+    """
+    mp = pytest.MonkeyPatch()
+    mp.setenv("MYPY_CACHE_DIR", str(tmp_path_factory.mktemp("mypy_cache")))
+    yield
+    mp.undo()
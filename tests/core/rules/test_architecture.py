@@ -1,6 +1,10 @@
 """Tests for Architecture Rules — RED phase."""
 
+import os
 from pathlib import Path
+from typing import Any
+
+import pytest
 
 
 class TestCircularImportRule:
@@ -139,3 +143,77 @@ class TestCouplingMetricRule:
 
         rule = CouplingMetricRule()
         assert rule.rule_id == "ARCH_COUPLING"
+
+
+class TestParseCache:
+    """Tests for the shared AST parse cache."""
+
+    def test_unchanged_file_parsed_once(self, tmp_path: Path) -> None:
+        """Re-reading identical source reuses the tree; edits re-parse."""
+        from axm_audit.core.rules.architecture import _parse_file_safe
+
+        path = tmp_path / "mod.py"
+        path.write_text("x = 1\n")
+
+        first = _parse_file_safe(path)
+        assert first is not None
+        assert _parse_file_safe(path) is first
+
+        path.write_text("x = 2\n")
+        assert _parse_file_safe(path) is not first
+
+    def test_syntax_error_returns_none(self, tmp_path: Path) -> None:
+        """Unparseable files yield None rather than raising."""
+        from axm_audit.core.rules.architecture import _parse_file_safe
+
+        path = tmp_path / "broken.py"
+        path.write_text("def (:\n")
+        assert _parse_file_safe(path) is None
+
+
+class TestGetPythonFiles:
+    """Tests for the source tree walk shared by AST rules."""
+
+    def test_finds_nested_files_and_skips_cache_dirs(self, tmp_path: Path) -> None:
+        """Nested .py files are found; __pycache__ and .venv are pruned."""
+        from axm_audit.core.rules.architecture import _get_python_files
+
+        (tmp_path / "pkg" / "sub").mkdir(parents=True)
+        (tmp_path / "pkg" / "__pycache__").mkdir()
+        (tmp_path / ".venv").mkdir()
+        (tmp_path / "top.py").write_text("")
+        (tmp_path / "pkg" / "sub" / "deep.py").write_text("")
+        (tmp_path / "pkg" / "notes.txt").write_text("")
+        (tmp_path / "pkg" / "__pycache__" / "cached.py").write_text("")
+        (tmp_path / ".venv" / "lib.py").write_text("")
+
+        found = sorted(
+            p.relative_to(tmp_path).as_posix() for p in _get_python_files(tmp_path)
+        )
+        assert found == ["pkg/sub/deep.py", "top.py"]
+
+    def test_missing_directory_returns_empty(self, tmp_path: Path) -> None:
+        """A missing directory yields no files."""
+        from axm_audit.core.rules.architecture import _get_python_files
+
+        assert _get_python_files(tmp_path / "missing") == []
+
+    def test_unreadable_directory_is_skipped(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A subdirectory that cannot be listed is skipped, not fatal."""
+        from axm_audit.core.rules.architecture import _get_python_files
+
+        (tmp_path / "locked").mkdir()
+        (tmp_path / "locked" / "hidden.py").write_text("")
+        (tmp_path / "ok.py").write_text("")
+        real_scandir = os.scandir
+
+        def _scandir(path: str) -> Any:
+            if path.endswith("locked"):
+                raise PermissionError(path)
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", _scandir)
+
+        assert _get_python_files(tmp_path) == [tmp_path / "ok.py"]
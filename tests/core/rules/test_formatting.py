@@ -6,6 +6,8 @@ import subprocess
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 _PATCH = "axm_audit.core.rules.quality.run_in_project"
 
 
@@ -150,6 +152,7 @@ class TestFormattingRule:
 class TestFormattingRuleIntegration:
     """Functional tests for FormattingRule via audit_project."""
 
+    @pytest.mark.slow
     def test_audit_includes_format_rule(self, tmp_path: Path) -> None:
         """audit_project with quality category includes QUALITY_FORMAT."""
         from axm_audit.core.auditor import audit_project
@@ -2,14 +2,34 @@
 
 from pathlib import Path
 
+import pytest
+
+from axm_audit.core.rules.practices import (
+    _SECRET_PATTERNS,
+    BareExceptRule,
+    DocstringCoverageRule,
+    SecurityPatternRule,
+    _compile_secret_patterns,
+)
+from axm_audit.formatters import format_agent
+from axm_audit.models.results import AuditResult, CheckResult, Severity
+
+# 15 undocumented + 1 documented = 6.25% coverage → fails
+_MANY_FUNCS_SRC = (
+    "\n".join(f"def func_{i}() -> None:\n    pass\n" for i in range(15))
+    + '\ndef documented() -> None:\n    """Has a docstring."""\n    pass\n'
+)
+
 
 class TestDocstringCoverageRule:
     """Tests for DocstringCoverageRule."""
 
-    def test_fully_documented_passes(self, tmp_path: Path) -> None:
-        """All public functions with docstrings should pass."""
-        from axm_audit.core.rules.practices import DocstringCoverageRule
+    rule_class = DocstringCoverageRule
 
+    def test_fully_documented_passes(
+        self, tmp_path: Path, rule: DocstringCoverageRule
+    ) -> None:
+        """All public functions with docstrings should pass."""
         src = tmp_path / "src"
         src.mkdir()
         (src / "documented.py").write_text('''
@@ -22,16 +42,15 @@ def another_public() -> str:
     return "hello"
 ''')
 
-        rule = DocstringCoverageRule()
         result = rule.check(tmp_path)
         assert result.passed is True
         assert result.details is not None
         assert result.details["coverage"] >= 0.80
 
-    def test_missing_docstrings_fails(self, tmp_path: Path) -> None:
+    def test_missing_docstrings_fails(
+        self, tmp_path: Path, rule: DocstringCoverageRule
+    ) -> None:
         """Functions without docstrings should reduce coverage."""
-        from axm_audit.core.rules.practices import DocstringCoverageRule
-
         src = tmp_path / "src"
         src.mkdir()
         (src / "undocumented.py").write_text('''
@@ -49,16 +68,15 @@ def func_four() -> None:
     pass
 ''')
 
-        rule = DocstringCoverageRule()
         result = rule.check(tmp_path)
         assert result.passed is False
         assert result.details is not None
         assert result.details["coverage"] < 0.80
 
-    def test_private_functions_ignored(self, tmp_path: Path) -> None:
+    def test_private_functions_ignored(
+        self, tmp_path: Path, rule: DocstringCoverageRule
+    ) -> None:
         """Private functions (starting with _) should not count."""
-        from axm_audit.core.rules.practices import DocstringCoverageRule
-
         src = tmp_path / "src"
         src.mkdir()
         (src / "private.py").write_text('''
@@ -71,25 +89,21 @@ def _private_helper() -> None:
     pass
 ''')
 
-        rule = DocstringCoverageRule()
         result = rule.check(tmp_path)
         assert result.passed is True
 
-    def test_rule_id_format(self) -> None:
+    def test_rule_id_format(self, rule: DocstringCoverageRule) -> None:
         """Rule ID should be PRACTICE_DOCSTRING."""
-        from axm_audit.core.rules.practices import DocstringCoverageRule
-
-        rule = DocstringCoverageRule()
         assert rule.rule_id == "PRACTICE_DOCSTRING"
 
 
 class TestBareExceptRule:
     """Tests for BareExceptRule."""
 
-    def test_typed_except_passes(self, tmp_path: Path) -> None:
-        """Typed except clauses should pass."""
-        from axm_audit.core.rules.practices import BareExceptRule
+    rule_class = BareExceptRule
 
+    def test_typed_except_passes(self, tmp_path: Path, rule: BareExceptRule) -> None:
+        """Typed except clauses should pass."""
         src = tmp_path / "src"
         src.mkdir()
         (src / "good.py").write_text("""
@@ -101,14 +115,11 @@ except (ValueError, TypeError) as e:
     print(e)
 """)
 
-        rule = BareExceptRule()
         result = rule.check(tmp_path)
         assert result.passed is True
 
-    def test_bare_except_fails(self, tmp_path: Path) -> None:
+    def test_bare_except_fails(self, tmp_path: Path, rule: BareExceptRule) -> None:
         """Bare except: should fail."""
-        from axm_audit.core.rules.practices import BareExceptRule
-
         src = tmp_path / "src"
         src.mkdir()
         (src / "bad.py").write_text("""
@@ -118,27 +129,23 @@ except:
     pass  # Bare except!
 """)
 
-        rule = BareExceptRule()
         result = rule.check(tmp_path)
         assert result.passed is False
         assert result.details is not None
         assert result.details["bare_except_count"] > 0
 
-    def test_rule_id_format(self) -> None:
+    def test_rule_id_format(self, rule: BareExceptRule) -> None:
         """Rule ID should be PRACTICE_BARE_EXCEPT."""
-        from axm_audit.core.rules.practices import BareExceptRule
-
-        rule = BareExceptRule()
         assert rule.rule_id == "PRACTICE_BARE_EXCEPT"
 
 
 class TestSecurityPatternRule:
     """Tests for SecurityPatternRule."""
 
-    def test_no_secrets_passes(self, tmp_path: Path) -> None:
-        """Code without hardcoded secrets should pass."""
-        from axm_audit.core.rules.practices import SecurityPatternRule
+    rule_class = SecurityPatternRule
 
+    def test_no_secrets_passes(self, tmp_path: Path, rule: SecurityPatternRule) -> None:
+        """Code without hardcoded secrets should pass."""
         src = tmp_path / "src"
         src.mkdir()
         (src / "clean.py").write_text("""
@@ -148,14 +155,13 @@ password = os.environ.get("PASSWORD")
 api_key = os.getenv("API_KEY")
 """)
 
-        rule = SecurityPatternRule()
         result = rule.check(tmp_path)
         assert result.passed is True
 
-    def test_hardcoded_password_fails(self, tmp_path: Path) -> None:
+    def test_hardcoded_password_fails(
+        self, tmp_path: Path, rule: SecurityPatternRule
+    ) -> None:
         """Hardcoded password should fail."""
-        from axm_audit.core.rules.practices import SecurityPatternRule
-
         src = tmp_path / "src"
         src.mkdir()
         (src / "bad.py").write_text("""
@@ -163,17 +169,13 @@ password = "super_secret_123"
 api_key = "sk-1234567890"
 """)
 
-        rule = SecurityPatternRule()
         result = rule.check(tmp_path)
         assert result.passed is False
         assert result.details is not None
         assert result.details["secret_count"] > 0
 
-    def test_rule_id_format(self) -> None:
+    def test_rule_id_format(self, rule: SecurityPatternRule) -> None:
         """Rule ID should be PRACTICE_SECURITY."""
-        from axm_audit.core.rules.practices import SecurityPatternRule
-
-        rule = SecurityPatternRule()
         assert rule.rule_id == "PRACTICE_SECURITY"
 
 
@@ -183,44 +185,38 @@ api_key = "sk-1234567890"
 class TestDocstringMissingDetail:
     """Tests for missing docstring listing (no cap, all items shown)."""
 
-    def test_missing_no_cap(self, tmp_path: Path) -> None:
-        """All missing docstrings are returned, not capped at 10."""
-        from axm_audit.core.rules.practices import DocstringCoverageRule
+    rule_class = DocstringCoverageRule
 
+    def test_missing_no_cap(self, tmp_path: Path, rule: DocstringCoverageRule) -> None:
+        """All missing docstrings are returned, not capped at 10."""
         src = tmp_path / "src"
         src.mkdir()
-        # 15 undocumented + 1 documented = 6.25% coverage → fails
-        funcs = "\n".join(f"def func_{i}() -> None:\n    pass\n" for i in range(15))
-        funcs += '\ndef documented() -> None:\n    """Has a docstring."""\n    pass\n'
-        (src / "many.py").write_text(funcs)
+        (src / "many.py").write_text(_MANY_FUNCS_SRC)
 
-        rule = DocstringCoverageRule()
         result = rule.check(tmp_path)
         assert result.details is not None
         assert len(result.details["missing"]) == 15
 
-    def test_missing_list_contains_locations(self, tmp_path: Path) -> None:
+    def test_missing_list_contains_locations(
+        self, tmp_path: Path, rule: DocstringCoverageRule
+    ) -> None:
         """Each missing entry has file:function format."""
-        from axm_audit.core.rules.practices import DocstringCoverageRule
-
         src = tmp_path / "src"
         src.mkdir()
         (src / "mod.py").write_text("def foo() -> None:\n    pass\n")
 
-        rule = DocstringCoverageRule()
         result = rule.check(tmp_path)
         assert result.details is not None
         assert any("foo" in m for m in result.details["missing"])
 
-    def test_fully_documented_empty_missing(self, tmp_path: Path) -> None:
+    def test_fully_documented_empty_missing(
+        self, tmp_path: Path, rule: DocstringCoverageRule
+    ) -> None:
         """100% coverage returns empty missing list."""
-        from axm_audit.core.rules.practices import DocstringCoverageRule
-
         src = tmp_path / "src"
         src.mkdir()
         (src / "ok.py").write_text('def ok() -> None:\n    """Ok."""\n    pass\n')
 
-        rule = DocstringCoverageRule()
         result = rule.check(tmp_path)
         assert result.details is not None
         assert result.details["missing"] == []
@@ -232,65 +228,78 @@ class TestDocstringMissingDetail:
 class TestFormatAgentActionable:
     """Tests for format_agent surfacing details on passed checks."""
 
-    def test_passed_with_missing_includes_details(self) -> None:
-        """Passed check with missing docstrings includes full details."""
-        from axm_audit.formatters import format_agent
-        from axm_audit.models.results import AuditResult, CheckResult, Severity
-
+    @pytest.mark.parametrize(
+        "rule_id,message,details,fix_hint,expect_dict",
+        [
+            pytest.param(
+                "PRACTICE_DOCSTRING",
+                "Docstring coverage: 88% (7/8)",
+                {
+                    "coverage": 0.88,
+                    "total": 8,
+                    "documented": 7,
+                    "missing": ["mod.py:foo"],
+                },
+                "Add docstrings to public functions",
+                True,
+                id="missing-items-include-details",
+            ),
+            pytest.param(
+                "QUALITY_TYPE",
+                "Type score: 100/100",
+                {"score": 100},
+                None,
+                False,
+                id="clean-is-string",
+            ),
+            pytest.param(
+                "PRACTICE_DOCSTRING",
+                "Docstring coverage: 100% (8/8)",
+                {"coverage": 1.0, "total": 8, "documented": 8, "missing": []},
+                None,
+                False,
+                id="empty-missing-is-string",
+            ),
+        ],
+    )
+    def test_passed_entry_shape(
+        self,
+        rule_id: str,
+        message: str,
+        details: dict[str, object],
+        fix_hint: str | None,
+        expect_dict: bool,
+    ) -> None:
+        """Passed checks carry details only when they have actionable items."""
         check = CheckResult(
-            rule_id="PRACTICE_DOCSTRING",
+            rule_id=rule_id,
             passed=True,
-            message="Docstring coverage: 88% (7/8)",
+            message=message,
             severity=Severity.INFO,
-            details={
-                "coverage": 0.88,
-                "total": 8,
-                "documented": 7,
-                "missing": ["mod.py:foo"],
-            },
-            fix_hint="Add docstrings to public functions",
+            details=details,
+            fix_hint=fix_hint,
         )
-        result = AuditResult(checks=[check])
-        output = format_agent(result)
+        output = format_agent(AuditResult(checks=[check]))
 
-        # Passed entry should be a dict with details, not a plain string
         assert len(output["passed"]) == 1
         entry = output["passed"][0]
-        assert isinstance(entry, dict)
-        assert entry["details"]["missing"] == ["mod.py:foo"]
-
-    def test_passed_clean_is_string(self) -> None:
-        """Passed check with no actionable items stays as summary string."""
-        from axm_audit.formatters import format_agent
-        from axm_audit.models.results import AuditResult, CheckResult, Severity
-
-        check = CheckResult(
-            rule_id="QUALITY_TYPE",
-            passed=True,
-            message="Type score: 100/100",
-            severity=Severity.INFO,
-            details={"score": 100},
-        )
-        result = AuditResult(checks=[check])
-        output = format_agent(result)
-
-        assert len(output["passed"]) == 1
-        assert isinstance(output["passed"][0], str)
-
-    def test_passed_empty_missing_is_string(self) -> None:
-        """Passed check with empty missing list stays as summary string."""
-        from axm_audit.formatters import format_agent
-        from axm_audit.models.results import AuditResult, CheckResult, Severity
-
-        check = CheckResult(
-            rule_id="PRACTICE_DOCSTRING",
-            passed=True,
-            message="Docstring coverage: 100% (8/8)",
-            severity=Severity.INFO,
-            details={"coverage": 1.0, "total": 8, "documented": 8, "missing": []},
-        )
-        result = AuditResult(checks=[check])
-        output = format_agent(result)
-
-        assert len(output["passed"]) == 1
-        assert isinstance(output["passed"][0], str)
+        if expect_dict:
+            assert isinstance(entry, dict)
+            assert entry["details"] == details
+        else:
+            assert isinstance(entry, str)
+
+
+class TestSecretPatternCompilation:
+    """Tests for the compiled secret-pattern cache."""
+
+    def test_patterns_compiled_once(self) -> None:
+        """Equal pattern tuples share one compiled set."""
+        first = _compile_secret_patterns(_SECRET_PATTERNS)
+        assert _compile_secret_patterns(tuple(_SECRET_PATTERNS)) is first
+        assert [key for _, key in first] == [
+            "password",
+            "secret",
+            "api_key",
+            "token",
+        ]
@@ -2,83 +2,80 @@
 
 from pathlib import Path
 
+from axm_audit.core.rules.structure import (
+    DirectoryExistsRule,
+    FileExistsRule,
+    PyprojectCompletenessRule,
+)
+
+_PYPROJECT_COMMON = (
+    b'description = "A package"\n'
+    b'requires-python = ">=3.12"\n'
+    b'license = "MIT"\n'
+    b'readme = "README.md"\n'
+    b'authors = [{name = "Test"}]\n'
+    b'classifiers = ["Development Status :: 3"]\n'
+    b"\n"
+    b"[project.urls]\n"
+    b'Homepage = "https://example.com"\n'
+)
+PYPROJECT_COMPLETE = (
+    b'[project]\nname = "my-pkg"\nversion = "1.0.0"\n' + _PYPROJECT_COMMON
+)
+PYPROJECT_DYNAMIC_VERSION = (
+    b'[project]\nname = "my-pkg"\ndynamic = ["version"]\n' + _PYPROJECT_COMMON
+)
+PYPROJECT_MINIMAL = b'[project]\nname = "my-pkg"\n'
+
 
 class TestPyprojectCompletenessRule:
     """Tests for PyprojectCompletenessRule (PEP 621 validation)."""
 
-    def test_complete_pyproject_passes(self, tmp_path: Path) -> None:
-        """All 9 fields present → score=100, passed=True."""
-        from axm_audit.core.rules.structure import PyprojectCompletenessRule
+    rule_class = PyprojectCompletenessRule
 
+    def test_complete_pyproject_passes(
+        self, tmp_path: Path, rule: PyprojectCompletenessRule
+    ) -> None:
+        """All 9 fields present → score=100, passed=True."""
         pyproject = tmp_path / "pyproject.toml"
-        pyproject.write_text(
-            "[project]\n"
-            'name = "my-pkg"\n'
-            'version = "1.0.0"\n'
-            'description = "A package"\n'
-            'requires-python = ">=3.12"\n'
-            'license = "MIT"\n'
-            'readme = "README.md"\n'
-            'authors = [{name = "Test"}]\n'
-            'classifiers = ["Development Status :: 3"]\n'
-            "\n"
-            "[project.urls]\n"
-            'Homepage = "https://example.com"\n'
-        )
-
-        rule = PyprojectCompletenessRule()
+        pyproject.write_bytes(PYPROJECT_COMPLETE)
+
         result = rule.check(tmp_path)
 
         assert result.passed is True
         assert result.details is not None
         assert result.details["score"] == 100
 
-    def test_minimal_pyproject_fails(self, tmp_path: Path) -> None:
+    def test_minimal_pyproject_fails(
+        self, tmp_path: Path, rule: PyprojectCompletenessRule
+    ) -> None:
         """Only name → low score, passed=False."""
-        from axm_audit.core.rules.structure import PyprojectCompletenessRule
-
         pyproject = tmp_path / "pyproject.toml"
-        pyproject.write_text('[project]\nname = "my-pkg"\n')
+        pyproject.write_bytes(PYPROJECT_MINIMAL)
 
-        rule = PyprojectCompletenessRule()
         result = rule.check(tmp_path)
 
         assert result.passed is False
         assert result.details is not None
         assert result.details["score"] < 50
 
-    def test_dynamic_version_counts(self, tmp_path: Path) -> None:
+    def test_dynamic_version_counts(
+        self, tmp_path: Path, rule: PyprojectCompletenessRule
+    ) -> None:
         """dynamic = ['version'] should count as version present."""
-        from axm_audit.core.rules.structure import PyprojectCompletenessRule
-
         pyproject = tmp_path / "pyproject.toml"
-        pyproject.write_text(
-            "[project]\n"
-            'name = "my-pkg"\n'
-            'dynamic = ["version"]\n'
-            'description = "A package"\n'
-            'requires-python = ">=3.12"\n'
-            'license = "MIT"\n'
-            'readme = "README.md"\n'
-            'authors = [{name = "Test"}]\n'
-            'classifiers = ["Development Status :: 3"]\n'
-            "\n"
-            "[project.urls]\n"
-            'Homepage = "https://example.com"\n'
-        )
-
-        rule = PyprojectCompletenessRule()
+        pyproject.write_bytes(PYPROJECT_DYNAMIC_VERSION)
+
         result = rule.check(tmp_path)
 
         assert result.passed is True
         assert result.details is not None
         assert result.details["score"] == 100
 
-    def test_missing_pyproject_fails(self, tmp_path: Path) -> None:
+    def test_missing_pyproject_fails(
+        self, tmp_path: Path, rule: PyprojectCompletenessRule
+    ) -> None:
         """No pyproject.toml → score=0, passed=False."""
-        from axm_audit.core.rules.structure import PyprojectCompletenessRule
-
-        rule = PyprojectCompletenessRule()
         result = rule.check(tmp_path)
 
         assert result.passed is False
@@ -87,18 +84,15 @@ class TestPyprojectCompletenessRule:
 
     def test_rule_id(self) -> None:
         """Rule ID should be STRUCTURE_PYPROJECT."""
-        from axm_audit.core.rules.structure import PyprojectCompletenessRule
-
         assert PyprojectCompletenessRule().rule_id == "STRUCTURE_PYPROJECT"
 
-    def test_malformed_toml(self, tmp_path: Path) -> None:
+    def test_malformed_toml(
+        self, tmp_path: Path, rule: PyprojectCompletenessRule
+    ) -> None:
         """Malformed pyproject.toml → parse error result."""
-        from axm_audit.core.rules.structure import PyprojectCompletenessRule
-
         pyproject = tmp_path / "pyproject.toml"
         pyproject.write_text("[project\nbroken syntax")
 
-        rule = PyprojectCompletenessRule()
         result = rule.check(tmp_path)
 
         assert result.passed is False
@@ -106,14 +100,23 @@ class TestPyprojectCompletenessRule:
         assert result.details is not None
         assert result.details["score"] == 0
 
+    def test_non_utf8_pyproject(
+        self, tmp_path: Path, rule: PyprojectCompletenessRule
+    ) -> None:
+        """Invalid UTF-8 is reported as a parse error, not raised."""
+        (tmp_path / "pyproject.toml").write_bytes(b'[project]\nname = "\xff"\n')
+
+        result = rule.check(tmp_path)
+
+        assert result.passed is False
+        assert "parse error" in result.message
+
 
 class TestFileExistsRule:
     """Tests for FileExistsRule."""
 
     def test_file_exists(self, tmp_path: Path) -> None:
         """Existing file passes."""
-        from axm_audit.core.rules.structure import FileExistsRule
-
         (tmp_path / "README.md").write_text("# Hello")
 
         rule = FileExistsRule(file_name="README.md")
@@ -124,8 +127,6 @@ class TestFileExistsRule:
 
     def test_file_missing(self, tmp_path: Path) -> None:
         """Missing file fails."""
-        from axm_audit.core.rules.structure import FileExistsRule
-
         rule = FileExistsRule(file_name="README.md")
         result = rule.check(tmp_path)
 
@@ -134,8 +135,6 @@ class TestFileExistsRule:
 
     def test_rule_id_includes_filename(self) -> None:
         """Rule ID should include the filename."""
-        from axm_audit.core.rules.structure import FileExistsRule
-
         rule = FileExistsRule(file_name="README.md")
         assert rule.rule_id == "FILE_EXISTS_README.md"
 
@@ -145,8 +144,6 @@ class TestDirectoryExistsRule:
 
     def test_directory_exists(self, tmp_path: Path) -> None:
         """Existing directory passes."""
-        from axm_audit.core.rules.structure import DirectoryExistsRule
-
         (tmp_path / "src").mkdir()
 
         rule = DirectoryExistsRule(dir_name="src")
@@ -157,8 +154,6 @@ class TestDirectoryExistsRule:
 
     def test_directory_missing(self, tmp_path: Path) -> None:
         """Missing directory fails."""
-        from axm_audit.core.rules.structure import DirectoryExistsRule
-
         rule = DirectoryExistsRule(dir_name="src")
         result = rule.check(tmp_path)
 
@@ -167,7 +162,5 @@ class TestDirectoryExistsRule:
 
     def test_rule_id_includes_dirname(self) -> None:
         """Rule ID should include the dir name."""
-        from axm_audit.core.rules.structure import DirectoryExistsRule
-
         rule = DirectoryExistsRule(dir_name="tests")
         assert rule.rule_id == "DIR_EXISTS_tests"
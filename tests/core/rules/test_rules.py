@@ -21,35 +21,19 @@ class TestRulesMigration:
             "PRACTICE_SECURITY",
         ],
     )
-    def test_rule_exists_and_functional(self, rule_id, tmp_path):
+    def test_rule_exists_and_functional(self, rule_id, all_rule_ids):
         """Test that each rule exists and can execute."""
-        from axm_audit import get_rules_for_category
+        assert rule_id in all_rule_ids
 
-        (tmp_path / "pyproject.toml").write_text("[project]\nname='test'")
-        (tmp_path / "src").mkdir()
-
-        all_rules = get_rules_for_category(None)
-        rule_ids = [rule.rule_id for rule in all_rules]
-
-        assert rule_id in rule_ids
-
-    def test_all_rules_have_check_method(self):
+    def test_all_rules_have_check_method(self, all_rules):
         """Test that all rules implement the check() method."""
-        from axm_audit import get_rules_for_category
-
-        rules = get_rules_for_category(None)
-
-        for rule in rules:
+        for rule in all_rules:
             assert hasattr(rule, "check")
             assert callable(rule.check)
 
-    def test_all_rules_have_rule_id(self):
+    def test_all_rules_have_rule_id(self, all_rules):
         """Test that all rules have a rule_id property."""
-        from axm_audit import get_rules_for_category
-
-        rules = get_rules_for_category(None)
-
-        for rule in rules:
+        for rule in all_rules:
             assert hasattr(rule, "rule_id")
             assert isinstance(rule.rule_id, str)
             assert len(rule.rule_id) > 0
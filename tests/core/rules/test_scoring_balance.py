@@ -1,33 +1,45 @@
 """Tests for scoring balance across all quality rules."""
 
+import pytest
 
-class TestScoringBalance:
-    """Verify that scoring formulas are balanced across rules."""
-
-    def test_lint_rule_penalty_appropriate(self):
-        """Linting: 2 points per issue is reasonable for 50 issues = fail."""
-        # 50 issues = 100 - 50*2 = 0 (fail)
-        # 10 issues = 100 - 10*2 = 80 (pass)
-        assert 100 - 50 * 2 == 0
-        assert 100 - 10 * 2 == 80
+from axm_audit.core.rules.quality import _complexity_score, _lint_score, _type_score
+from axm_audit.core.rules.security import _security_score
 
-    def test_type_rule_penalty_appropriate(self):
-        """Type checking: 5 points per error for 4 errors = fail."""
-        # 4 errors = 100 - 4*5 = 80 (borderline)
-        # 5 errors = 100 - 5*5 = 75 (fail)
-        assert 100 - 4 * 5 == 80
-        assert 100 - 5 * 5 == 75
 
-    def test_complexity_rule_penalty_appropriate(self):
-        """Complexity: 10 points per high-CC function for 2 = fail."""
-        # 2 high-CC = 100 - 2*10 = 80 (borderline)
-        # 3 high-CC = 100 - 3*10 = 70 (fail)
-        assert 100 - 2 * 10 == 80
-        assert 100 - 3 * 10 == 70
+class TestScoringBalance:
+    """Verify that scoring formulas are balanced across rules."""
 
-    def test_security_rule_penalty_appropriate(self):
-        """Security: 15 points per HIGH, 5 per MEDIUM."""
-        # 1 HIGH + 1 MEDIUM = 100 - (1*15 + 1*5) = 80 (borderline)
-        # 2 HIGH = 100 - 2*15 = 70 (fail)
-        assert 100 - (1 * 15 + 1 * 5) == 80
-        assert 100 - 2 * 15 == 70
+    @pytest.mark.parametrize(
+        ("fn", "args", "expected"),
+        [
+            # Linting: 2 points per issue — 10 issues pass, 50 floor at 0
+            (_lint_score, (10,), 80),
+            (_lint_score, (50,), 0),
+            (_lint_score, (80,), 0),
+            # Type checking: 5 points per error — 4 borderline, 5 fail
+            (_type_score, (4,), 80),
+            (_type_score, (5,), 75),
+            # Complexity: 10 points per high-CC function — 2 borderline, 3 fail
+            (_complexity_score, (2,), 80),
+            (_complexity_score, (3,), 70),
+            # Security: 15 points per HIGH, 5 per MEDIUM
+            (_security_score, (1, 1), 80),
+            (_security_score, (2, 0), 70),
+            (_security_score, (0, 30), 0),
+        ],
+        ids=[
+            "lint-pass",
+            "lint-zero",
+            "lint-floor",
+            "type-borderline",
+            "type-fail",
+            "complexity-borderline",
+            "complexity-fail",
+            "security-borderline",
+            "security-fail",
+            "security-floor",
+        ],
+    )
+    def test_rule_penalty_appropriate(self, fn, args, expected):
+        """Each rule's scoring function yields the documented score."""
+        assert fn(*args) == expected
@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import json
 import subprocess
+from collections import Counter
+from collections.abc import Callable
 from pathlib import Path
-from unittest.mock import MagicMock
+from typing import Any
 
 import pytest
 
@@ -13,6 +15,62 @@ from axm_audit.core.rules.security import SecurityRule
 from axm_audit.models.results import Severity
 
 
+def _bandit_report(*results: dict[str, Any]) -> str:
+    """Serialize a Bandit JSON report with totals derived from ``results``."""
+    totals = Counter(r["issue_severity"] for r in results)
+    return json.dumps(
+        {
+            "results": list(results),
+            "metrics": {
+                "_totals": {
+                    f"SEVERITY.{sev}": totals[sev] for sev in ("HIGH", "MEDIUM", "LOW")
+                }
+            },
+        }
+    )
+
+
+# Canned reports, serialized once at import
+_NO_ISSUES_STDOUT = _bandit_report()
+_HIGH2_MED1_STDOUT = _bandit_report(
+    {"issue_severity": "HIGH", "issue_text": "Use of exec()"},
+    {"issue_severity": "HIGH", "issue_text": "Hardcoded password"},
+    {"issue_severity": "MEDIUM", "issue_text": "Weak crypto"},
+)
+_TOP_ISSUES_STDOUT = _bandit_report(
+    {
+        "issue_severity": "HIGH",
+        "issue_text": "Use of exec()",
+        "filename": "src/main.py",
+        "line_number": 42,
+        "test_id": "B102",
+    },
+    {
+        "issue_severity": "MEDIUM",
+        "issue_text": "Weak crypto",
+        "filename": "src/crypto.py",
+        "line_number": 10,
+        "test_id": "B304",
+    },
+)
+_ONE_HIGH_STDOUT = _bandit_report(
+    {"issue_severity": "HIGH", "issue_text": "Use of exec()"}
+)
+
+
+@pytest.fixture
+def mock_bandit(monkeypatch: pytest.MonkeyPatch) -> Callable[..., None]:
+    """Patch subprocess.run to return the given Bandit stdout."""
+
+    def _make(stdout: str = _NO_ISSUES_STDOUT) -> None:
+        proc = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout=stdout, stderr=""
+        )
+        monkeypatch.setattr(subprocess, "run", lambda *_args, **_kwargs: proc)
+
+    return _make
+
+
 class TestSecurityRule:
     """Tests for SecurityRule (Bandit integration)."""
 
@@ -30,126 +88,51 @@ class TestSecurityRule:
         assert result.severity == Severity.ERROR
         assert "src/ directory not found" in result.message
 
-    def test_no_issues_perfect_score(
-        self,
-        tmp_path: Path,
-        monkeypatch: pytest.MonkeyPatch,
-    ) -> None:
-        """Should return 100/100 if no security issues."""
-        src_path = tmp_path / "src"
-        src_path.mkdir()
-
-        # Mock subprocess.run to return no issues
-        mock_result = MagicMock()
-        mock_result.stdout = json.dumps(
-            {
-                "results": [],
-                "metrics": {
-                    "_totals": {
-                        "SEVERITY.HIGH": 0,
-                        "SEVERITY.MEDIUM": 0,
-                        "SEVERITY.LOW": 0,
-                    }
-                },
-            }
-        )
-        mock_result.returncode = 0
-
-        mock_run = MagicMock(return_value=mock_result)
-        monkeypatch.setattr(subprocess, "run", mock_run)
-
-        rule = SecurityRule()
-        result = rule.check(tmp_path)
-
-        assert result.passed
-        assert result.details is not None
-        assert result.details["score"] == 100
-        assert result.details["high_count"] == 0
-        assert result.details["medium_count"] == 0
-        assert result.severity == Severity.INFO
-
-    def test_high_severity_issues_scoring(
+    @pytest.mark.parametrize(
+        ("stdout", "score", "high", "med", "passed", "severity"),
+        [
+            pytest.param(_NO_ISSUES_STDOUT, 100, 0, 0, True, Severity.INFO, id="clean"),
+            # Score = 100 - (2*15 + 1*5) = 65, below the 80 pass mark
+            pytest.param(
+                _HIGH2_MED1_STDOUT, 65, 2, 1, False, Severity.WARNING, id="2high-1med"
+            ),
+            pytest.param(_ONE_HIGH_STDOUT, 85, 1, 0, True, Severity.INFO, id="1high"),
+        ],
+    )
+    def test_scoring(
         self,
         tmp_path: Path,
-        monkeypatch: pytest.MonkeyPatch,
+        mock_bandit: Callable[..., None],
+        stdout: str,
+        score: int,
+        high: int,
+        med: int,
+        passed: bool,
+        severity: Severity,
     ) -> None:
-        """Should penalize high severity issues heavily (15 points each)."""
-        src_path = tmp_path / "src"
-        src_path.mkdir()
-
-        # Mock 2 HIGH, 1 MEDIUM issue
-        mock_result = MagicMock()
-        mock_result.stdout = json.dumps(
-            {
-                "results": [
-                    {"issue_severity": "HIGH", "issue_text": "Use of exec()"},
-                    {"issue_severity": "HIGH", "issue_text": "Hardcoded password"},
-                    {"issue_severity": "MEDIUM", "issue_text": "Weak crypto"},
-                ],
-                "metrics": {
-                    "_totals": {
-                        "SEVERITY.HIGH": 2,
-                        "SEVERITY.MEDIUM": 1,
-                        "SEVERITY.LOW": 0,
-                    }
-                },
-            }
-        )
+        """HIGH issues cost 15 points, MEDIUM 5; pass mark is 80."""
+        (tmp_path / "src").mkdir()
+        mock_bandit(stdout)
 
-        mock_run = MagicMock(return_value=mock_result)
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        result = SecurityRule().check(tmp_path)
 
-        rule = SecurityRule()
-        result = rule.check(tmp_path)
-
-        # Score = 100 - (2*15 + 1*5) = 100 - 35 = 65
         assert result.details is not None
-        assert result.details["score"] == 65
-        assert result.details["high_count"] == 2
-        assert result.details["medium_count"] == 1
-        assert not result.passed  # < 80
-        assert result.severity == Severity.WARNING
+        assert result.details["score"] == score
+        assert result.details["high_count"] == high
+        assert result.details["medium_count"] == med
+        assert result.passed is passed
+        assert result.severity == severity
 
     def test_top_issues_reported(
         self,
         tmp_path: Path,
-        monkeypatch: pytest.MonkeyPatch,
+        mock_bandit: Callable[..., None],
     ) -> None:
         """Should report top 5 security issues."""
         src_path = tmp_path / "src"
         src_path.mkdir()
 
-        mock_result = MagicMock()
-        mock_result.stdout = json.dumps(
-            {
-                "results": [
-                    {
-                        "issue_severity": "HIGH",
-                        "issue_text": "Use of exec()",
-                        "filename": "src/main.py",
-                        "line_number": 42,
-                        "test_id": "B102",
-                    },
-                    {
-                        "issue_severity": "MEDIUM",
-                        "issue_text": "Weak crypto",
-                        "filename": "src/crypto.py",
-                        "line_number": 10,
-                        "test_id": "B304",
-                    },
-                ],
-                "metrics": {
-                    "_totals": {
-                        "SEVERITY.HIGH": 1,
-                        "SEVERITY.MEDIUM": 1,
-                        "SEVERITY.LOW": 0,
-                    }
-                },
-            }
-        )
-
-        mock_run = MagicMock(return_value=mock_result)
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        mock_bandit(_TOP_ISSUES_STDOUT)
 
         rule = SecurityRule()
         result = rule.check(tmp_path)
@@ -162,28 +145,13 @@ class TestSecurityRule:
     def test_fix_hint_provided(
         self,
         tmp_path: Path,
-        monkeypatch: pytest.MonkeyPatch,
+        mock_bandit: Callable[..., None],
     ) -> None:
         """Should provide fix hint when issues found."""
         src_path = tmp_path / "src"
         src_path.mkdir()
 
-        mock_result = MagicMock()
-        mock_result.stdout = json.dumps(
-            {
-                "results": [{"issue_severity": "HIGH", "issue_text": "Use of exec()"}],
-                "metrics": {
-                    "_totals": {
-                        "SEVERITY.HIGH": 1,
-                        "SEVERITY.MEDIUM": 0,
-                        "SEVERITY.LOW": 0,
-                    }
-                },
-            }
-        )
-
-        mock_run = MagicMock(return_value=mock_result)
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        mock_bandit(_ONE_HIGH_STDOUT)
 
         rule = SecurityRule()
         result = rule.check(tmp_path)
@@ -194,17 +162,13 @@ class TestSecurityRule:
     def test_json_decode_error_handling(
         self,
         tmp_path: Path,
-        monkeypatch: pytest.MonkeyPatch,
+        mock_bandit: Callable[..., None],
     ) -> None:
         """Should handle invalid JSON gracefully."""
         src_path = tmp_path / "src"
         src_path.mkdir()
 
-        mock_result = MagicMock()
-        mock_result.stdout = "invalid json"
-
-        mock_run = MagicMock(return_value=mock_result)
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        mock_bandit("invalid json")
 
         rule = SecurityRule()
         result = rule.check(tmp_path)
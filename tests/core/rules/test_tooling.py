@@ -2,60 +2,75 @@
 
 from pathlib import Path
 
+import pytest
+
+from axm_audit.core.rules.tooling import ToolAvailabilityRule, _which
+from axm_audit.models.results import Severity
+from axm_audit.utils import clear_audit_caches
+
+# Tool availability ignores the project path
+_CWD = Path(".")
+
+
+@pytest.fixture(scope="module")
+def py_rule() -> ToolAvailabilityRule:
+    """Rule for a tool that is always on PATH."""
+    return ToolAvailabilityRule(tool_name="python3")
+
 
 class TestToolAvailabilityRule:
     """Tests for tool availability checks."""
 
-    def test_tool_found_python(self) -> None:
+    def test_tool_found_python(self, py_rule: ToolAvailabilityRule) -> None:
         """Python should always be available."""
-        from axm_audit.core.rules.tooling import ToolAvailabilityRule
-
-        rule = ToolAvailabilityRule(tool_name="python3")
-        result = rule.check(Path("."))
+        result = py_rule.check(_CWD)
         assert result.passed is True
         assert "found" in result.message
 
     def test_tool_not_found(self) -> None:
         """Non-existent tool should fail."""
-        from axm_audit.core.rules.tooling import ToolAvailabilityRule
-
         rule = ToolAvailabilityRule(tool_name="nonexistent_tool_xyz_12345")
-        result = rule.check(Path("."))
+        result = rule.check(_CWD)
         assert result.passed is False
         assert result.fix_hint is not None
 
     def test_rule_id_format(self) -> None:
         """Rule ID should be TOOL_<NAME> uppercase."""
-        from axm_audit.core.rules.tooling import ToolAvailabilityRule
-
         rule = ToolAvailabilityRule(tool_name="ruff")
         assert rule.rule_id == "TOOL_RUFF"
 
     def test_non_critical_missing_tool_has_warning_severity(self) -> None:
         """Non-critical missing tool should have WARNING severity."""
-        from axm_audit.core.rules.tooling import ToolAvailabilityRule
-        from axm_audit.models.results import Severity
-
         rule = ToolAvailabilityRule(tool_name="nonexistent_xyz", critical=False)
-        result = rule.check(Path("."))
+        result = rule.check(_CWD)
         assert result.passed is False
         assert result.severity == Severity.WARNING
 
     def test_critical_missing_tool_has_error_severity(self) -> None:
         """Critical missing tool should have ERROR severity."""
-        from axm_audit.core.rules.tooling import ToolAvailabilityRule
-        from axm_audit.models.results import Severity
-
         rule = ToolAvailabilityRule(tool_name="nonexistent_xyz", critical=True)
-        result = rule.check(Path("."))
+        result = rule.check(_CWD)
         assert result.passed is False
         assert result.severity == Severity.ERROR
 
-    def test_found_tool_has_info_severity(self) -> None:
+    def test_found_tool_has_info_severity(self, py_rule: ToolAvailabilityRule) -> None:
         """Found tool should have INFO severity."""
-        from axm_audit.core.rules.tooling import ToolAvailabilityRule
-        from axm_audit.models.results import Severity
-
-        rule = ToolAvailabilityRule(tool_name="python3")
-        result = rule.check(Path("."))
+        result = py_rule.check(_CWD)
         assert result.severity == Severity.INFO
+
+    def test_path_lookup_cached_per_tool(self) -> None:
+        """Repeated checks of the same tool scan PATH only once."""
+        _which.cache_clear()
+        ToolAvailabilityRule(tool_name="python3").check(_CWD)
+        ToolAvailabilityRule(tool_name="python3", critical=False).check(_CWD)
+
+        info = _which.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_path_lookup_cleared_between_audits(self) -> None:
+        """clear_audit_caches drops memoized PATH lookups."""
+        ToolAvailabilityRule(tool_name="python3").check(_CWD)
+        clear_audit_caches()
+
+        assert _which.cache_info().currsize == 0
@@ -1,56 +1,57 @@
 """Tests for core auditor functionality."""
 
+import concurrent.futures
 from pathlib import Path
 
 import pytest
 
+from axm_audit import AuditResult, audit_project, get_rules_for_category
+from axm_audit.core.auditor import run_rules
+from axm_audit.core.rules.architecture import CouplingMetricRule, _parse_source
+from axm_audit.core.rules.quality import LintingRule
+from axm_audit.core.rules.structure import DirectoryExistsRule, FileExistsRule
+from axm_audit.core.rules.tooling import ToolAvailabilityRule, _which
+from axm_audit.core.runner import _has_venv
+
+
+@pytest.fixture(scope="module")
+def full_audit(tmp_path_factory: pytest.TempPathFactory) -> AuditResult:
+    """Run one unfiltered audit of a bare project for the whole module."""
+    root = tmp_path_factory.mktemp("full_audit")
+    (root / "pyproject.toml").write_text("[project]\nname='test'")
+    (root / "src").mkdir()
+    return audit_project(root)
+
 
 class TestAuditProjectFunction:
     """Test the main audit_project() function in axm-audit."""
 
     def test_audit_project_exists(self):
         """Test that audit_project can be imported from axm_audit."""
-        from axm_audit import audit_project
-
         assert callable(audit_project)
 
     def test_audit_project_signature(self):
         """Test that audit_project has the correct signature."""
-        import inspect
-
-        from axm_audit import audit_project
-
-        sig = inspect.signature(audit_project)
-        params = list(sig.parameters.keys())
+        code = audit_project.__code__
+        params = code.co_varnames[: code.co_argcount + code.co_kwonlyargcount]
 
         assert "project_path" in params
         assert "category" in params
         assert "quick" in params
 
-    def test_audit_project_returns_audit_result(self, tmp_path):
+    @pytest.mark.slow
+    def test_audit_project_returns_audit_result(self, full_audit):
         """Test that audit_project returns an AuditResult object."""
-        from axm_audit import AuditResult, audit_project
-
-        # Create minimal project structure
-        (tmp_path / "pyproject.toml").write_text("[project]\nname='test'")
-        (tmp_path / "src").mkdir()
-
-        result = audit_project(tmp_path)
-        assert isinstance(result, AuditResult)
+        assert isinstance(full_audit, AuditResult)
 
     def test_audit_project_nonexistent_path_raises_error(self):
         """Test that audit_project raises FileNotFoundError for invalid path."""
-        from axm_audit import audit_project
-
         with pytest.raises(FileNotFoundError):
             audit_project(Path("/nonexistent/path"))
 
     def test_audit_project_invalid_category_raises_error(self, tmp_path):
         """Test that audit_project raises ValueError for invalid category."""
-        from axm_audit import audit_project
-
-        (tmp_path / "pyproject.toml").write_text("[project]\nname='test'")
-
+        # Category is validated before any rule touches the project tree
         with pytest.raises(ValueError, match="Invalid category"):
             audit_project(tmp_path, category="invalid_category")
 
@@ -58,33 +59,33 @@ class TestAuditProjectFunction:
         "category",
         [
             "structure",
-            "quality",
+            pytest.param("quality", marks=pytest.mark.slow),
             "architecture",
             "practice",
-            "security",
-            "dependencies",
-            "testing",
+            pytest.param("security", marks=pytest.mark.slow),
+            pytest.param("dependencies", marks=pytest.mark.slow),
+            pytest.param("testing", marks=pytest.mark.slow),
             "tooling",
         ],
     )
-    def test_audit_project_category_filtering(self, tmp_path, category):
-        """Test that category filtering works for all valid categories."""
-        from axm_audit import audit_project
-
-        (tmp_path / "pyproject.toml").write_text("[project]\nname='test'")
-        (tmp_path / "src").mkdir()
-
-        result = audit_project(tmp_path, category=category)
-        assert result is not None
-
-    def test_audit_project_quick_mode(self, tmp_path):
+    def test_audit_project_category_filtering(self, minimal_project, category):
+        """Filtering by category runs exactly that category's rules."""
+        result = audit_project(minimal_project, category=category)
+        assert {c.rule_id for c in result.checks} == {
+            r.rule_id for r in get_rules_for_category(category)
+        }
+
+    def test_audit_project_results_not_cached(self, minimal_project):
+        """Each call audits afresh; results are never memoized by path."""
+        first = audit_project(minimal_project, category="architecture")
+        second = audit_project(minimal_project, category="architecture")
+        assert first is not second
+        assert first.checks[0] is not second.checks[0]
+
+    @pytest.mark.slow
+    def test_audit_project_quick_mode(self, minimal_project):
         """Test that quick mode runs only lint and type checks."""
-        from axm_audit import audit_project
-
-        (tmp_path / "pyproject.toml").write_text("[project]\nname='test'")
-        (tmp_path / "src").mkdir()
-
-        result = audit_project(tmp_path, quick=True)
+        result = audit_project(minimal_project, quick=True)
         # Quick mode should run fewer checks
         assert result.total <= 2  # Only lint and type checks
 
@@ -94,14 +95,10 @@ class TestGetRulesForCategory:
 
     def test_get_rules_for_category_exists(self):
         """Test that get_rules_for_category can be imported."""
-        from axm_audit import get_rules_for_category
-
         assert callable(get_rules_for_category)
 
     def test_get_rules_all_categories(self):
         """Test getting all rules (no category filter)."""
-        from axm_audit import get_rules_for_category
-
         rules = get_rules_for_category(None)
         assert len(rules) == 18  # All 18 rules (added FormattingRule)
 
@@ -120,22 +117,16 @@ class TestGetRulesForCategory:
     )
     def test_get_rules_by_category(self, category, expected_min):
         """Test getting rules filtered by category."""
-        from axm_audit import get_rules_for_category
-
         rules = get_rules_for_category(category)
         assert len(rules) >= expected_min
 
     def test_get_rules_quick_mode(self):
         """Test that quick mode returns only lint and type rules."""
-        from axm_audit import get_rules_for_category
-
         rules = get_rules_for_category(None, quick=True)
         assert len(rules) == 2  # Only lint and type
 
     def test_get_rules_invalid_category(self):
         """Test that invalid category raises ValueError."""
-        from axm_audit import get_rules_for_category
-
         with pytest.raises(ValueError):
             get_rules_for_category("invalid")
 
@@ -143,32 +134,21 @@ class TestGetRulesForCategory:
 class TestAuditParallelExecution:
     """Tests for parallel rule execution and exception isolation."""
 
-    def test_audit_uses_thread_pool(self, tmp_path, mocker):
+    @pytest.mark.slow
+    def test_audit_uses_thread_pool(self, minimal_project, mocker):
         """Verify rules execute via ThreadPoolExecutor."""
-        import concurrent.futures
-
-        (tmp_path / "pyproject.toml").write_text("[project]\nname='test'")
-        (tmp_path / "src").mkdir()
-
         spy = mocker.spy(concurrent.futures, "ThreadPoolExecutor")
 
-        from axm_audit import audit_project
-
-        audit_project(tmp_path, quick=True)
+        audit_project(minimal_project, quick=True)
         spy.assert_called_once()
 
-    def test_rule_exception_doesnt_crash_others(self, tmp_path, mocker):
+    @pytest.mark.slow
+    def test_rule_exception_doesnt_crash_others(self, minimal_project, mocker):
         """One rule raising should not prevent others from completing."""
-        from axm_audit.core.auditor import audit_project
-        from axm_audit.core.rules.quality import LintingRule
-
-        (tmp_path / "pyproject.toml").write_text("[project]\nname='test'")
-        (tmp_path / "src").mkdir()
-
         # Make LintingRule crash
         mocker.patch.object(LintingRule, "check", side_effect=RuntimeError("boom"))
 
-        result = audit_project(tmp_path, category="quality")
+        result = audit_project(minimal_project, category="quality")
         # Other quality rules still ran (TypeCheckRule, ComplexityRule)
         assert result.total >= 2
 
@@ -177,3 +157,31 @@ class TestAuditParallelExecution:
         assert len(lint_checks) == 1
         assert not lint_checks[0].passed
         assert "crashed" in lint_checks[0].message.lower()
+
+    def test_run_rules_preserves_input_order(self, tmp_path):
+        """run_rules returns one result per rule, in the order given."""
+        (tmp_path / "README.md").write_text("# Test")
+        rules = [
+            FileExistsRule(file_name="README.md"),
+            DirectoryExistsRule(dir_name="missing"),
+            FileExistsRule(file_name="LICENSE"),
+        ]
+
+        results = run_rules(rules, tmp_path, max_workers=2)
+        assert [r.rule_id for r in results] == [r.rule_id for r in rules]
+        assert [r.passed for r in results] == [True, False, False]
+
+    def test_run_rules_clears_audit_caches(self, tmp_path):
+        """Parsed sources, PATH and venv lookups are not kept after the run."""
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "mod.py").write_text("import os\n")
+        _has_venv(tmp_path)
+
+        run_rules(
+            [CouplingMetricRule(), ToolAvailabilityRule(tool_name="python3")],
+            tmp_path,
+        )
+        assert _parse_source.cache_info().currsize == 0
+        assert _which.cache_info().currsize == 0
+        assert _has_venv.cache_info().currsize == 0
@@ -0,0 +1,47 @@
+"""Shared test helpers that are not fixtures."""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+from axm_audit.models.results import CheckResult
+
+
+def make_check(rule_id: str, score: float) -> CheckResult:
+    """Create a passed CheckResult carrying a score.
+
+    Inputs are known-good, so validation is skipped.
+    """
+    return CheckResult.model_construct(
+        rule_id=rule_id,
+        passed=True,
+        message="",
+        details={"score": score},
+    )
+
+
+class FakeOrjson:
+    """Stand-in for the ``orjson`` module, built on the stdlib ``json``.
+
+    Lets the tests exercise the ``fast`` extra's code paths without the
+    package installed; ``calls`` records how often it encoded.
+    """
+
+    OPT_INDENT_2 = 1
+    OPT_NON_STR_KEYS = 2
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def dumps(
+        self,
+        obj: Any,
+        default: Callable[[Any], Any] | None = None,
+        option: int = 0,
+    ) -> bytes:
+        """Encode ``obj`` like ``orjson.dumps`` with the options used here."""
+        self.calls += 1
+        indent = 2 if option & self.OPT_INDENT_2 else None
+        return json.dumps(
+            obj, default=default, indent=indent, ensure_ascii=False
+        ).encode()
@@ -1,26 +1,19 @@
 """Tests for audit models."""
 
+import pytest
+from pydantic import ValidationError
+from pydantic_core import from_json
 
-class TestModels:
-    """Test that audit models work correctly in axm-audit."""
-
-    def test_audit_result_import(self):
-        """Test that AuditResult can be imported."""
-        from axm_audit.models import AuditResult
-
-        assert AuditResult is not None
-
-    def test_check_result_import(self):
-        """Test that CheckResult can be imported."""
-        from axm_audit.models import CheckResult
+from axm_audit import models
+from axm_audit.models import AuditResult, CheckResult, Severity
 
-        assert CheckResult is not None
 
-    def test_severity_import(self):
-        """Test that Severity can be imported."""
-        from axm_audit.models import Severity
+class TestModels:
+    """Test that audit models work correctly in axm-audit."""
 
-        assert Severity is not None
+    def test_models_exported(self) -> None:
+        """Audit models are exported from axm_audit.models."""
+        assert sorted(models.__all__) == ["AuditResult", "CheckResult", "Severity"]
 
 
 class TestCheckResult:
@@ -28,8 +21,6 @@ class TestCheckResult:
 
     def test_passed_check(self) -> None:
         """Passed check should have passed=True."""
-        from axm_audit.models.results import CheckResult
-
         result = CheckResult(
             rule_id="FILE_EXISTS",
             passed=True,
@@ -40,8 +31,6 @@ class TestCheckResult:
 
     def test_failed_check(self) -> None:
         """Failed check should have passed=False."""
-        from axm_audit.models.results import CheckResult
-
         result = CheckResult(
             rule_id="FILE_EXISTS",
             passed=False,
@@ -49,10 +38,23 @@ class TestCheckResult:
         )
         assert result.passed is False
 
+    def test_check_result_is_frozen(self) -> None:
+        """CheckResult fields cannot be reassigned after construction."""
+        result = CheckResult(rule_id="FILE_EXISTS", passed=True, message="ok")
+        with pytest.raises(ValidationError):
+            result.passed = False  # type: ignore[misc]
+
+    def test_rule_id_is_interned(self) -> None:
+        """Equal rule ids built at runtime share one string object."""
+        suffix = "LINT"
+        a = CheckResult(rule_id=f"QUALITY_{suffix}", passed=True, message="ok")
+        b = CheckResult(
+            rule_id="".join(["QUALITY_", suffix]), passed=True, message="ok"
+        )
+        assert a.rule_id is b.rule_id
+
     def test_audit_result_creation(self):
         """Test creating an AuditResult instance."""
-        from axm_audit.models import AuditResult, CheckResult
-
         check = CheckResult(rule_id="TEST", passed=True, message="Test")
         result = AuditResult(checks=[check])
 
@@ -61,8 +63,6 @@ class TestCheckResult:
 
     def test_audit_result_failure(self) -> None:
         """Audit with some checks failed."""
-        from axm_audit.models.results import AuditResult, CheckResult
-
         checks = [
             CheckResult(rule_id="F1", passed=True, message="OK"),
             CheckResult(rule_id="F2", passed=False, message="FAIL"),
@@ -72,24 +72,16 @@ class TestCheckResult:
         assert result.total == 2
         assert result.failed == 1
 
-    def test_json_serialization(self) -> None:
+    def test_json_serialization(self, make_audit_result) -> None:
         """AuditResult should serialize to valid JSON for Agents."""
-        import json
-
-        from axm_audit.models.results import AuditResult, CheckResult
-
-        result = AuditResult(
-            checks=[CheckResult(rule_id="TEST", passed=True, message="OK")]
-        )
-        data = json.loads(result.model_dump_json())
+        result = make_audit_result("TEST")
+        data = from_json(result.model_dump_json())
         assert "checks" in data
         assert "success" in data
         assert data["success"] is True
 
     def test_audit_result_quality_score(self):
         """Test that quality scoring works."""
-        from axm_audit.models import AuditResult, CheckResult
-
         checks = [
             CheckResult(
                 rule_id="QUALITY_LINT",
@@ -111,8 +103,6 @@ class TestCheckResult:
 
     def test_audit_result_grade(self):
         """Test that letter grading works."""
-        from axm_audit.models import AuditResult, CheckResult
-
         checks = [
             CheckResult(
                 rule_id="QUALITY_LINT",
@@ -123,4 +113,76 @@ class TestCheckResult:
         ]
         result = AuditResult(checks=checks)
 
-        assert result.grade in ["A", "B", "C", "D", "F"]
+        assert result.grade in {"A", "B", "C", "D", "F"}
+
+    def test_audit_result_summary_computed_once(self) -> None:
+        """Summary fields share one cached pass and stay out of the dump."""
+        result = AuditResult(
+            checks=[
+                CheckResult(rule_id="QUALITY_LINT", passed=False, message="x"),
+                CheckResult(rule_id="QUALITY_TYPE", passed=True, message="y"),
+            ]
+        )
+        summary = result._summary
+        assert result.failed == 1
+        assert result.success is False
+        assert result._summary is summary
+        assert "_summary" not in result.model_dump()
+
+    def test_model_copy_recomputes_summary(self) -> None:
+        """A copy with new checks does not inherit the original summary."""
+        result = AuditResult(
+            checks=[
+                CheckResult(
+                    rule_id="QUALITY_LINT",
+                    passed=True,
+                    message="ok",
+                    details={"score": 100},
+                )
+            ]
+        )
+        failing = CheckResult(
+            rule_id="QUALITY_LINT", passed=False, message="ko", details={"score": 10}
+        )
+        copy = result.model_copy(update={"checks": (failing,)})
+
+        assert result.success is True
+        assert copy.success is False
+        assert copy.failed == 1
+        assert copy.quality_score == 2.0
+
+    def test_audit_result_checks_is_tuple(self) -> None:
+        """List input is stored as an immutable tuple."""
+        check = CheckResult(rule_id="TEST", passed=True, message="Test")
+        result = AuditResult(checks=[check])
+        assert result.checks == (check,)
+        assert AuditResult().checks == ()
+
+    def test_from_checks_matches_validated_result(self) -> None:
+        """from_checks builds the same result as the validating constructor."""
+        checks = [
+            CheckResult(rule_id="QUALITY_LINT", passed=True, message="ok"),
+            CheckResult(rule_id="QUALITY_TYPE", passed=False, message="ko"),
+        ]
+        result = AuditResult.from_checks(checks)
+        assert result == AuditResult(checks=checks)
+        assert result.checks == tuple(checks)
+        assert result.failed == 1
+
+    def test_blocking_failures_counts_error_severity_only(self) -> None:
+        """Only failed ERROR checks block; warnings and passes do not."""
+        result = AuditResult(
+            checks=[
+                CheckResult(rule_id="A", passed=False, message="x"),
+                CheckResult(
+                    rule_id="B",
+                    passed=False,
+                    message="y",
+                    severity=Severity.WARNING,
+                ),
+                CheckResult(rule_id="C", passed=True, message="z"),
+            ]
+        )
+        assert result.failed == 2
+        assert result.blocking_failures == 1
+        assert result.model_dump()["blocking_failures"] == 1
@@ -1,55 +1,73 @@
 """Tests for the 8-category composite quality score formula."""
 
+from itertools import permutations
+
 import pytest
 
-from axm_audit.models.results import AuditResult, CheckResult
+from axm_audit.models.results import _CATEGORY_WEIGHTS, AuditResult, CheckResult
+from tests.helpers import make_check
 
 
-def _make_check(rule_id: str, score: float) -> CheckResult:
-    """Helper to create a CheckResult with a score."""
-    return CheckResult(
-        rule_id=rule_id,
-        passed=True,
-        message="",
-        details={"score": score},
-    )
+def _make_checks(*scores: tuple[str, float]) -> tuple[CheckResult, ...]:
+    """Build a frozen test vector of scored checks."""
+    return tuple(make_check(rule_id, score) for rule_id, score in scores)
+
+
+# Test vectors, built once at import
+_CHECKS_8CAT = _make_checks(
+    ("QUALITY_LINT", 90),  # 90 * 0.20 = 18
+    ("QUALITY_TYPE", 85),  # 85 * 0.15 = 12.75
+    ("QUALITY_COMPLEXITY", 95),  # 95 * 0.15 = 14.25
+    ("QUALITY_SECURITY", 100),  # 100 * 0.10 = 10
+    ("DEPS_AUDIT", 100),  # avg(100,100) * 0.10 = 10
+    ("DEPS_HYGIENE", 100),
+    ("QUALITY_COVERAGE", 90),  # 90 * 0.15 = 13.5
+    ("ARCH_COUPLING", 100),  # 100 * 0.10 = 10
+    ("PRACTICE_DOCSTRING", 100),  # avg(100,100,100)*0.05 = 5
+    ("PRACTICE_BARE_EXCEPT", 100),
+    ("PRACTICE_SECURITY", 100),
+)
+_CHECKS_PARTIAL = _make_checks(
+    ("QUALITY_LINT", 80),  # 80 * 0.20 = 16
+    ("QUALITY_TYPE", 60),  # 60 * 0.15 = 9
+)
+_CHECKS_DEPS_AVERAGE = _make_checks(
+    ("DEPS_AUDIT", 100),  # avg(100,40) * 0.10 = 7
+    ("DEPS_HYGIENE", 40),
+)
 
 
 class TestQualityScore:
     """Tests for the quality scoring logic."""
 
-    def test_quality_score_8_category_formula(self):
+    @pytest.mark.parametrize(
+        ("checks", "expected"),
+        [
+            pytest.param(_CHECKS_8CAT, 93.5, id="8cat"),
+            pytest.param(_CHECKS_PARTIAL, 25.0, id="missing-categories-count-zero"),
+            pytest.param(_CHECKS_DEPS_AVERAGE, 7.0, id="category-average"),
+        ],
+    )
+    def test_quality_score_formula(
+        self, checks: tuple[CheckResult, ...], expected: float
+    ) -> None:
         """Quality score uses 8-category weighted model."""
-        checks = [
-            _make_check("QUALITY_LINT", 90),  # 90 * 0.20 = 18
-            _make_check("QUALITY_TYPE", 85),  # 85 * 0.15 = 12.75
-            _make_check("QUALITY_COMPLEXITY", 95),  # 95 * 0.15 = 14.25
-            _make_check("QUALITY_SECURITY", 100),  # 100 * 0.10 = 10
-            _make_check("DEPS_AUDIT", 100),  # avg(100,100) * 0.10 = 10
-            _make_check("DEPS_HYGIENE", 100),
-            _make_check("QUALITY_COVERAGE", 90),  # 90 * 0.15 = 13.5
-            _make_check("ARCH_COUPLING", 100),  # 100 * 0.10 = 10
-            _make_check("PRACTICE_DOCSTRING", 100),  # avg(100,100,100)*0.05 = 5
-            _make_check("PRACTICE_BARE_EXCEPT", 100),
-            _make_check("PRACTICE_SECURITY", 100),
-        ]
-
         result = AuditResult(checks=checks)
 
-        # Expected: 18 + 12.75 + 14.25 + 10 + 10 + 13.5 + 10 + 5 = 93.5
-        assert result.quality_score == pytest.approx(93.5, abs=0.1)
+        assert result.quality_score == pytest.approx(expected, abs=0.1)
 
-    def test_quality_score_weights_sum_to_100(self):
-        """Weights should sum to 100%."""
-        weights = {
-            "lint": 0.20,
-            "type": 0.15,
-            "complexity": 0.15,
-            "security": 0.10,
-            "deps": 0.10,
-            "testing": 0.15,
-            "architecture": 0.10,
-            "practices": 0.05,
+    def test_quality_score_independent_of_check_order(self) -> None:
+        """Rounded score is the same for every ordering of the checks."""
+        checks = _make_checks(
+            ("DEPS_AUDIT", 81), ("QUALITY_TYPE", 19), ("QUALITY_LINT", 66)
+        )
+        scores = {
+            AuditResult(checks=order).quality_score for order in permutations(checks)
         }
 
-        assert sum(weights.values()) == pytest.approx(1.0)
+        assert scores == {AuditResult(checks=checks).quality_score}
+
+    def test_quality_score_weights_sum_to_100(self):
+        """Weights should sum to 100%."""
+        assert len(_CATEGORY_WEIGHTS) == 8
+        assert sum(_CATEGORY_WEIGHTS.values()) == pytest.approx(1.0)
@@ -1,101 +1,113 @@
 """Tests for reporters."""
 
+import json
+from typing import Any
+
+import pytest
+
+from axm_audit import reporters
+from axm_audit.models import AuditResult, CheckResult, Severity
+from axm_audit.reporters import JsonReporter, MarkdownReporter
+from tests.helpers import FakeOrjson
+
+
+@pytest.fixture(scope="module")
+def sample_audit_result() -> AuditResult:
+    """One result covering passes, a failure with a fix hint, and a score."""
+    return AuditResult(
+        checks=[
+            CheckResult(
+                rule_id="FILE_EXISTS_pyproject.toml", passed=True, message="OK"
+            ),
+            CheckResult(
+                rule_id="FILE_EXISTS_README.md",
+                passed=False,
+                message="Missing",
+                fix_hint="Run ruff fix",
+            ),
+            CheckResult(
+                rule_id="QUALITY_LINT",
+                passed=True,
+                message="OK",
+                details={"score": 100},
+            ),
+        ]
+    )
+
+
+@pytest.fixture(scope="module")
+def json_output(sample_audit_result: AuditResult) -> str:
+    """JsonReporter output for the sample result, rendered once."""
+    return JsonReporter().render(sample_audit_result)
+
+
+@pytest.fixture(scope="module")
+def md_output(sample_audit_result: AuditResult) -> str:
+    """MarkdownReporter output for the sample result, rendered once."""
+    return MarkdownReporter().render(sample_audit_result)
+
+
+@pytest.fixture(scope="module")
+def json_parsed(json_output: str) -> dict[str, Any]:
+    """JsonReporter output for the sample result, parsed once."""
+    return json.loads(json_output)
+
 
 class TestReporters:
     """Test that reporters work correctly in axm-audit."""
 
-    def test_json_reporter_import(self):
-        """Test that JsonReporter can be imported."""
-        from axm_audit.reporters import JsonReporter
-
-        assert JsonReporter is not None
-
-    def test_markdown_reporter_import(self):
-        """Test that MarkdownReporter can be imported."""
-        from axm_audit.reporters import MarkdownReporter
+    def test_reporters_exported(self) -> None:
+        """Both reporters are exported from axm_audit.reporters."""
+        assert sorted(reporters.__all__) == ["JsonReporter", "MarkdownReporter"]
 
-        assert MarkdownReporter is not None
-
-    def test_json_reporter_render(self) -> None:
+    def test_json_reporter_render(self, json_parsed: dict[str, Any]) -> None:
         """JsonReporter outputs valid JSON string."""
-        import json
-
-        from axm_audit.models import AuditResult, CheckResult
-        from axm_audit.reporters import JsonReporter
-
-        result = AuditResult(
-            checks=[
-                CheckResult(rule_id="TEST", passed=True, message="OK"),
-            ]
+        assert json_parsed["success"] is False
+        assert len(json_parsed["checks"]) == 3
+
+    @pytest.mark.parametrize("wrap", [True, False], ids=["audit", "check"])
+    def test_json_reporter_matches_model_dump(
+        self, json_backend: FakeOrjson | None, wrap: bool
+    ) -> None:
+        """JsonReporter output round-trips to the model's JSON-mode dump."""
+        check = CheckResult(
+            rule_id="QUALITY_LINT",
+            passed=False,
+            message="2 issues",
+            severity=Severity.WARNING,
+            details={"score": 80},
         )
-        reporter = JsonReporter()
-        output = reporter.render(result)
-
-        # Should be valid JSON
-        data = json.loads(output)
-        assert data["success"] is True
-        assert len(data["checks"]) == 1
-
-    def test_json_is_pure(self) -> None:
-        """JSON output has no Rich formatting or escape codes."""
-        from axm_audit.models import AuditResult, CheckResult
-        from axm_audit.reporters import JsonReporter
-
-        result = AuditResult(
-            checks=[CheckResult(rule_id="R1", passed=False, message="FAIL")]
+        result: AuditResult | CheckResult = (
+            AuditResult(checks=[check]) if wrap else check
         )
-        reporter = JsonReporter()
-        output = reporter.render(result)
+        output = JsonReporter().render(result)
+        assert json.loads(output) == result.model_dump(mode="json")
+        assert f'\n  "{"checks" if wrap else "rule_id"}"' in output
+        assert json_backend is None or json_backend.calls == 1
+
+    @pytest.mark.parametrize("output_fixture", ["json_output", "md_output"])
+    def test_output_is_pure(
+        self, request: pytest.FixtureRequest, output_fixture: str
+    ) -> None:
+        """Output has no Rich formatting or escape codes."""
+        output = request.getfixturevalue(output_fixture)
 
         # No ANSI escape codes
-        assert "\\x1b[" not in output
-        assert "\\033[" not in output
+        assert "\x1b" not in output
 
-    def test_markdown_reporter_render(self) -> None:
+    def test_markdown_reporter_render(self, md_output: str) -> None:
         """MarkdownReporter creates readable table."""
-        from axm_audit.models import AuditResult, CheckResult
-        from axm_audit.reporters import MarkdownReporter
-
-        result = AuditResult(
-            checks=[
-                CheckResult(
-                    rule_id="FILE_EXISTS_pyproject.toml", passed=True, message="OK"
-                ),
-                CheckResult(
-                    rule_id="FILE_EXISTS_README.md", passed=False, message="Missing"
-                ),
-            ]
-        )
-        reporter = MarkdownReporter()
-        output = reporter.render(result)
-
         # Should contain markdown table elements
-        assert "|" in output
-        assert "pyproject.toml" in output
-        assert "README.md" in output
+        assert "|" in md_output
+        assert "pyproject.toml" in md_output
+        assert "README.md" in md_output
 
-    def test_markdown_shows_summary(self) -> None:
+    def test_markdown_shows_summary(self, md_output: str) -> None:
         """Markdown includes summary statistics."""
-        from axm_audit.models import AuditResult, CheckResult
-        from axm_audit.reporters import MarkdownReporter
-
-        result = AuditResult(
-            checks=[
-                CheckResult(rule_id="R1", passed=True, message="OK"),
-                CheckResult(rule_id="R2", passed=False, message="FAIL"),
-            ]
-        )
-        reporter = MarkdownReporter()
-        output = reporter.render(result)
-
-        # Should show pass/fail counts
-        assert "1" in output  # 1 passed or 1 failed
+        assert "**Total:** 3 | **Passed:** 2 | **Failed:** 1" in md_output
 
     def test_markdown_non_audit_result(self) -> None:
         """MarkdownReporter falls back to JSON for non-AuditResult models."""
-        from axm_audit.models import CheckResult
-        from axm_audit.reporters import MarkdownReporter
-
         check = CheckResult(rule_id="R1", passed=True, message="OK")
         reporter = MarkdownReporter()
         output = reporter.render(check)
@@ -103,45 +115,21 @@ class TestReporters:
         # Should fallback to JSON
         assert "R1" in output
 
-    def test_markdown_fix_hints(self) -> None:
+    def test_markdown_fix_hints(self, md_output: str) -> None:
         """MarkdownReporter renders fix hints section for failed checks."""
-        from axm_audit.models import AuditResult, CheckResult
-        from axm_audit.reporters import MarkdownReporter
-
-        result = AuditResult(
-            checks=[
-                CheckResult(
-                    rule_id="R1",
-                    passed=False,
-                    message="FAIL",
-                    fix_hint="Run ruff fix",
-                ),
-            ]
-        )
-        reporter = MarkdownReporter()
-        output = reporter.render(result)
+        assert "Fix Hints" in md_output
+        assert "Run ruff fix" in md_output
 
-        assert "Fix Hints" in output
-        assert "Run ruff fix" in output
+    def test_markdown_escapes_table_cells(self, make_audit_result) -> None:
+        """Pipes and newlines in messages must not break the table row."""
+        result = make_audit_result(passed=False, message="a | b\r\nc")
+        output = MarkdownReporter().render(result)
 
-    def test_markdown_grade_display(self) -> None:
-        """MarkdownReporter shows grade when quality_score is present."""
-        from axm_audit.models import AuditResult, CheckResult
-        from axm_audit.reporters import MarkdownReporter
-
-        result = AuditResult(
-            checks=[
-                CheckResult(
-                    rule_id="QUALITY_LINT",
-                    passed=True,
-                    message="OK",
-                    details={"score": 100},
-                ),
-            ]
-        )
-        reporter = MarkdownReporter()
-        output = reporter.render(result)
+        assert "| R1 | ❌ | a \\| b c |" in output
 
-        # Should contain grade info if quality_score exists
-        if result.quality_score is not None and result.grade is not None:
-            assert result.grade in output
+    def test_markdown_grade_display(
+        self, sample_audit_result: AuditResult, md_output: str
+    ) -> None:
+        """MarkdownReporter shows grade when quality_score is present."""
+        assert sample_audit_result.grade is not None
+        assert f"**Grade:** {sample_audit_result.grade}" in md_output
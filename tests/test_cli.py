@@ -1,75 +1,96 @@
 """Tests for CLI (cyclopts) and formatters."""
 
+import inspect
+import io
+import json
+from contextlib import redirect_stdout
+from typing import Any
+
+import pytest
+
+from axm_audit.cli import app, audit
+from axm_audit.core.rules.quality import _extract_test_failures
+from axm_audit.formatters import (
+    format_agent,
+    format_agent_bytes,
+    format_json,
+    format_json_bytes,
+    format_report,
+)
+from axm_audit.models.results import AuditResult, CheckResult
+from tests.helpers import FakeOrjson
+
+
+@pytest.fixture(scope="module")
+def cli_result() -> AuditResult:
+    """A scored pass and a scored failure, shared by the formatter tests."""
+    return AuditResult(
+        checks=[
+            CheckResult(
+                rule_id="QUALITY_LINT",
+                passed=True,
+                message="Lint score: 100/100 (0 issues)",
+                details={"score": 100},
+            ),
+            CheckResult(
+                rule_id="QUALITY_TYPE",
+                passed=False,
+                message="FAIL",
+                details={"score": 0},
+            ),
+        ]
+    )
+
+
+@pytest.fixture(scope="module")
+def report_text(cli_result: AuditResult) -> str:
+    """format_report output for cli_result, rendered once."""
+    return format_report(cli_result)
+
+
+@pytest.fixture(scope="module")
+def json_dict(cli_result: AuditResult) -> dict[str, Any]:
+    """format_json output for cli_result, built once."""
+    return format_json(cli_result)
+
 
 class TestFormatReport:
     """Tests for format_report function."""
 
-    def test_report_contains_score(self) -> None:
+    def test_report_contains_score(self, report_text: str) -> None:
         """Report should display score and grade."""
-        from axm_audit.formatters import format_report
-        from axm_audit.models.results import AuditResult, CheckResult
-
-        result = AuditResult(
-            checks=[
-                CheckResult(
-                    rule_id="QUALITY_LINT",
-                    passed=True,
-                    message="Lint score: 100/100 (0 issues)",
-                    details={"score": 100},
-                ),
-            ]
-        )
-        report = format_report(result)
-        assert "Score:" in report
+        assert "Score:" in report_text
 
-    def test_report_shows_pass_fail_icons(self) -> None:
+    def test_report_shows_pass_fail_icons(self, report_text: str) -> None:
         """Report should use ✅ for pass and ❌ for fail."""
-        from axm_audit.formatters import format_report
-        from axm_audit.models.results import AuditResult, CheckResult
-
-        result = AuditResult(
-            checks=[
-                CheckResult(
-                    rule_id="QUALITY_LINT",
-                    passed=True,
-                    message="OK",
-                    details={"score": 100},
-                ),
-                CheckResult(
-                    rule_id="QUALITY_TYPE",
-                    passed=False,
-                    message="FAIL",
-                    details={"score": 0},
-                ),
-            ]
-        )
-        report = format_report(result)
-        assert "✅" in report
-        assert "❌" in report
+        assert "✅" in report_text
+        assert "❌" in report_text
 
 
 class TestFormatJson:
     """Tests for format_json function."""
 
-    def test_json_has_required_keys(self) -> None:
+    @pytest.mark.parametrize("key", ["score", "grade", "checks"])
+    def test_json_has_required_keys(self, json_dict: dict[str, Any], key: str) -> None:
         """JSON output should have score, grade, checks."""
-        from axm_audit.formatters import format_json
-        from axm_audit.models.results import AuditResult, CheckResult
+        assert key in json_dict
 
+    def test_json_bytes_matches_dict(self, json_backend: FakeOrjson | None) -> None:
+        """format_json_bytes should encode exactly what format_json returns."""
         result = AuditResult(
             checks=[
                 CheckResult(
                     rule_id="QUALITY_LINT",
-                    passed=True,
-                    message="OK",
-                    details={"score": 100},
+                    passed=False,
+                    message="2 issues — ❌",
+                    details={"score": 80, "issues": [{"code": "E501"}]},
                 ),
             ]
         )
-        data = format_json(result)
-        assert "score" in data
-        assert "grade" in data
-        assert "checks" in data
+        raw = format_json_bytes(result, indent=2)
+        assert isinstance(raw, bytes)
+        assert json.loads(raw) == format_json(result)
+        assert json_backend is None or json_backend.calls == 1
 
 
 class TestCLI:
@@ -77,36 +98,53 @@ class TestCLI:
 
     def test_version_command(self) -> None:
         """version command should print version."""
-        from axm_audit.cli import app
-
         # cyclopts apps can be tested by calling them directly
         # We just verify the app exists and has commands
         assert app is not None
 
     def test_audit_command_exists(self) -> None:
         """audit command should be registered."""
-        from axm_audit.cli import app
-
         assert app is not None
 
     def test_agent_flag_exists(self) -> None:
         """--agent flag should be accepted by audit command."""
-        import inspect
-
-        from axm_audit.cli import audit
-
         sig = inspect.signature(audit)
         assert "agent" in sig.parameters
 
+    @pytest.mark.parametrize(
+        ("flag", "encode"),
+        [
+            pytest.param("json_output", format_json_bytes, id="json"),
+            pytest.param("agent", format_agent_bytes, id="agent"),
+        ],
+    )
+    def test_machine_output_writes_encoded_bytes(
+        self, cli_result: AuditResult, tmp_path, mocker, capsys, flag, encode
+    ) -> None:
+        """--json / --agent should write the encoded payload to stdout."""
+        mocker.patch("axm_audit.core.auditor.audit_project", return_value=cli_result)
+        with pytest.raises(SystemExit):
+            audit(str(tmp_path), **{flag: True})
+
+        out = capsys.readouterr().out
+        assert out == encode(cli_result, indent=2).decode() + "\n"
+
+    def test_machine_output_without_byte_buffer(
+        self, cli_result: AuditResult, tmp_path, mocker
+    ) -> None:
+        """--json falls back to text when stdout has no binary buffer."""
+        mocker.patch("axm_audit.core.auditor.audit_project", return_value=cli_result)
+        with redirect_stdout(io.StringIO()) as out, pytest.raises(SystemExit):
+            audit(str(tmp_path), json_output=True)
+
+        assert out.getvalue() == format_json_bytes(cli_result, indent=2).decode() + "\n"
+
 
 class TestFormatAgent:
     """Tests for format_agent function."""
 
     def test_format_agent_all_passed(self) -> None:
         """All passing checks → failed=[], passed has 1-line strings."""
-        from axm_audit.formatters import format_agent
-        from axm_audit.models.results import AuditResult, CheckResult
-
         result = AuditResult(
             checks=[
                 CheckResult(
@@ -130,9 +168,6 @@ class TestFormatAgent:
 
     def test_format_agent_mixed(self) -> None:
         """Failed items have full detail, passed items are 1-liners."""
-        from axm_audit.formatters import format_agent
-        from axm_audit.models.results import AuditResult, CheckResult
-
         result = AuditResult(
             checks=[
                 CheckResult(
@@ -157,52 +192,39 @@ class TestFormatAgent:
         assert "fix_hint" in output["failed"][0]
         assert output["failed"][0]["fix_hint"] == "Add type hints"
 
-    def test_format_agent_no_score(self) -> None:
+    def test_format_agent_no_score(self, make_audit_result) -> None:
         """No crash when quality_score is None."""
-        from axm_audit.formatters import format_agent
-        from axm_audit.models.results import AuditResult, CheckResult
-
-        result = AuditResult(
-            checks=[
-                CheckResult(
-                    rule_id="FILE_EXISTS_README.md",
-                    passed=True,
-                    message="exists",
-                ),
-            ]
-        )
+        result = make_audit_result("FILE_EXISTS_README.md", message="exists")
         output = format_agent(result)
         assert output["score"] is None
         assert output["grade"] is None
 
-    def test_format_agent_has_required_keys(self) -> None:
+    def test_format_agent_has_required_keys(self, make_audit_result) -> None:
         """Agent output must have score, grade, passed, failed."""
-        from axm_audit.formatters import format_agent
-        from axm_audit.models.results import AuditResult, CheckResult
-
-        result = AuditResult(
-            checks=[
-                CheckResult(rule_id="R1", passed=True, message="OK"),
-            ]
-        )
+        result = make_audit_result()
         output = format_agent(result)
         assert set(output.keys()) == {"score", "grade", "passed", "failed"}
 
+    def test_agent_bytes_matches_dict(
+        self, cli_result: AuditResult, json_backend: FakeOrjson | None
+    ) -> None:
+        """format_agent_bytes should encode exactly what format_agent returns."""
+        raw = format_agent_bytes(cli_result)
+        assert isinstance(raw, bytes)
+        assert json.loads(raw) == format_agent(cli_result)
+        assert json_backend is None or json_backend.calls == 1
+
 
 class TestExtractTestFailures:
     """Tests for _extract_test_failures helper."""
 
     def test_no_failures(self) -> None:
         """Empty stdout → no failures."""
-        from axm_audit.core.rules.quality import _extract_test_failures
-
         assert _extract_test_failures("") == []
         assert _extract_test_failures("3 passed\n") == []
 
     def test_single_failure(self) -> None:
         """FAILED line parsed correctly."""
-        from axm_audit.core.rules.quality import _extract_test_failures
-
         stdout = "FAILED tests/test_foo.py::test_bar - AssertionError\n1 failed\n"
         failures = _extract_test_failures(stdout)
         assert len(failures) == 1
@@ -211,8 +233,6 @@ class TestExtractTestFailures:
 
     def test_multiple_failures(self) -> None:
         """Multiple FAILED lines parsed."""
-        from axm_audit.core.rules.quality import _extract_test_failures
-
         stdout = (
             "FAILED tests/test_a.py::test_one - err1\n"
             "FAILED tests/test_b.py::test_two - err2\n"
@@ -1,70 +1,80 @@
 """Tests for coupling metric fix and scoring integration."""
 
 import ast
+from collections.abc import Callable
+from functools import cache
 from pathlib import Path
 
 import pytest
 
-from axm_audit.models.results import AuditResult, CheckResult
+from axm_audit.core.rules.architecture import CouplingMetricRule, _extract_imports
+from axm_audit.models.results import AuditResult
+from tests.helpers import make_check
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
-def _make_check(rule_id: str, score: float) -> CheckResult:
-    """Helper to create a CheckResult with a score."""
-    return CheckResult(
-        rule_id=rule_id,
-        passed=True,
-        message="",
-        details={"score": score},
-    )
-
-
-# ---------------------------------------------------------------------------
-# 1. _extract_imports fix: count modules, not symbols
-# ---------------------------------------------------------------------------
+# (module name, number of distinct imports) per module under src/pkg
+ModuleSpec = tuple[tuple[str, int], ...]
 
 
-class TestExtractImports:
-    """Tests for _extract_imports counting modules not symbols."""
+@pytest.fixture(scope="session")
+def coupling_repo(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Callable[[ModuleSpec], Path]:
+    """Project trees for the coupling rule, built once per module spec.
 
-    def test_from_import_counts_module_not_symbols(self) -> None:
-        """'from foo import A, B, C' = 1 import, not 4."""
-        from axm_audit.core.rules.architecture import _extract_imports
+    CouplingMetricRule only reads the tree, so identical specs share one
+    directory across tests.
+    """
 
-        code = "from axm_init.models import CheckResult, Severity, Config"
-        tree = ast.parse(code)
-        imports = _extract_imports(tree)
-        # Should be just ["axm_init.models"], not 4 entries
-        assert len(imports) == 1
-        assert imports[0] == "axm_init.models"
+    @cache
+    def _build(spec: ModuleSpec) -> Path:
+        root = tmp_path_factory.mktemp("coupling")
+        src = root / "src" / "pkg"
+        src.mkdir(parents=True)
+        (src / "__init__.py").write_text("")
+        for name, n_imports in spec:
+            (src / f"{name}.py").write_text(
+                "\n".join([f"import dep_{j}" for j in range(n_imports)])
+            )
+        return root
 
-    def test_plain_import(self) -> None:
-        """'import os' = 1 import."""
-        from axm_audit.core.rules.architecture import _extract_imports
+    return _build
 
-        tree = ast.parse("import os")
-        imports = _extract_imports(tree)
-        assert imports == ["os"]
 
-    def test_relative_import_no_module(self) -> None:
-        """'from . import x' (module=None) produces 0 imports."""
-        from axm_audit.core.rules.architecture import _extract_imports
+# ---------------------------------------------------------------------------
+# 1. _extract_imports fix: count modules, not symbols
+# ---------------------------------------------------------------------------
 
-        tree = ast.parse("from . import x")
-        imports = _extract_imports(tree)
-        assert imports == []
 
-    def test_multiple_imports(self) -> None:
-        """Multiple distinct import statements are counted separately."""
-        from axm_audit.core.rules.architecture import _extract_imports
+class TestExtractImports:
+    """Tests for _extract_imports counting modules not symbols."""
 
-        code = "import os\nimport sys\nfrom pathlib import Path"
-        tree = ast.parse(code)
-        imports = _extract_imports(tree)
-        assert set(imports) == {"os", "sys", "pathlib"}
+    @pytest.mark.parametrize(
+        ("code", "expected"),
+        [
+            # 'from foo import A, B, C' = 1 import, not 4
+            pytest.param(
+                "from axm_init.models import CheckResult, Severity, Config",
+                ["axm_init.models"],
+                id="from-import-counts-module",
+            ),
+            pytest.param("import os", ["os"], id="plain-import"),
+            # module=None produces no import
+            pytest.param("from . import x", [], id="relative-no-module"),
+            pytest.param(
+                "import os\nimport sys\nfrom pathlib import Path",
+                ["os", "sys", "pathlib"],
+                id="multiple-imports",
+            ),
+        ],
+    )
+    def test_extract_imports(self, code: str, expected: list[str]) -> None:
+        """Each import statement contributes its source module once."""
+        assert _extract_imports(ast.parse(code)) == expected
 
 
 # ---------------------------------------------------------------------------
@@ -75,85 +85,45 @@ class TestExtractImports:
 class TestCouplingFormula:
     """Tests for the new coupling scoring formula."""
 
-    def test_all_below_threshold(self, tmp_path: Path) -> None:
-        """All modules below threshold → score=100, n_over=0."""
-        from axm_audit.core.rules.architecture import CouplingMetricRule
-
-        rule = CouplingMetricRule(fan_out_threshold=10)
-        src = tmp_path / "src" / "pkg"
-        src.mkdir(parents=True)
-
-        # Create 3 modules with < 10 imports each
-        for name, n_imports in [("a", 3), ("b", 5), ("c", 8)]:
-            imports = "\n".join(f"import mod_{i}" for i in range(n_imports))
-            (src / f"{name}.py").write_text(imports)
-        (src / "__init__.py").write_text("")
-
-        result = rule.check(tmp_path)
-        assert result.details is not None
-        score = result.details["score"]
-        assert score == 100
-        assert result.details["n_over_threshold"] == 0
-
-    def test_some_above_threshold(self, tmp_path: Path) -> None:
-        """2 modules above threshold → score=90."""
-        from axm_audit.core.rules.architecture import CouplingMetricRule
-
-        rule = CouplingMetricRule(fan_out_threshold=10)
-        src = tmp_path / "src" / "pkg"
-        src.mkdir(parents=True)
-
-        # a=5 (under), b=12 (over), c=15 (over)
-        (src / "a.py").write_text("\n".join(f"import m{i}" for i in range(5)))
-        (src / "b.py").write_text("\n".join(f"import m{i}" for i in range(12)))
-        (src / "c.py").write_text("\n".join(f"import m{i}" for i in range(15)))
-        (src / "__init__.py").write_text("")
-
-        result = rule.check(tmp_path)
-        assert result.details is not None
-        assert result.details["n_over_threshold"] == 2
-        assert result.details["score"] == 90  # 100 - 2*5
-
-    def test_many_above_threshold_floors_at_zero(self, tmp_path: Path) -> None:
-        """20+ modules above threshold → score=0."""
-        from axm_audit.core.rules.architecture import CouplingMetricRule
-
+    @pytest.mark.parametrize(
+        ("fan_outs", "expected_score", "expected_n_over"),
+        [
+            pytest.param([3, 5, 8], 100, 0, id="all-below"),
+            pytest.param([5, 12, 15], 90, 2, id="some-above"),  # 100 - 2*5
+            pytest.param([15] * 25, 0, 25, id="floors-at-zero"),
+        ],
+    )
+    def test_coupling_score(
+        self,
+        coupling_repo: Callable[[ModuleSpec], Path],
+        fan_outs: list[int],
+        expected_score: int,
+        expected_n_over: int,
+    ) -> None:
+        """Score is 100 - 5 per module over the fan-out threshold, floored at 0."""
         rule = CouplingMetricRule(fan_out_threshold=10)
-        src = tmp_path / "src" / "pkg"
-        src.mkdir(parents=True)
-
-        for i in range(25):
-            (src / f"mod_{i}.py").write_text(
-                "\n".join(f"import dep_{j}" for j in range(15))
-            )
-        (src / "__init__.py").write_text("")
+        root = coupling_repo(tuple((f"mod_{i}", n) for i, n in enumerate(fan_outs)))
 
-        result = rule.check(tmp_path)
+        result = rule.check(root)
         assert result.details is not None
-        assert result.details["score"] == 0
+        assert result.details["score"] == expected_score
+        assert result.details["n_over_threshold"] == expected_n_over
 
     def test_no_src_returns_100(self, tmp_path: Path) -> None:
         """No src/ directory → score=100."""
-        from axm_audit.core.rules.architecture import CouplingMetricRule
-
         rule = CouplingMetricRule()
         result = rule.check(tmp_path)
         assert result.details is not None
         assert result.details["score"] == 100
 
-    def test_over_threshold_lists_modules(self, tmp_path: Path) -> None:
+    def test_over_threshold_lists_modules(
+        self, coupling_repo: Callable[[ModuleSpec], Path]
+    ) -> None:
         """Details lists which modules exceed threshold."""
-        from axm_audit.core.rules.architecture import CouplingMetricRule
-
         rule = CouplingMetricRule(fan_out_threshold=10)
-        src = tmp_path / "src" / "pkg"
-        src.mkdir(parents=True)
+        root = coupling_repo((("ok", 1), ("big", 15)))
 
-        (src / "ok.py").write_text("import os")
-        (src / "big.py").write_text("\n".join(f"import m{i}" for i in range(15)))
-        (src / "__init__.py").write_text("")
-
-        result = rule.check(tmp_path)
+        result = rule.check(root)
         assert result.details is not None
         over = result.details["over_threshold"]
         assert len(over) == 1
@@ -173,14 +143,14 @@ class TestScoringWeights:
         """All weights must sum to 1.0."""
         # After the change, weights include architecture + practices
         checks = [
-            _make_check("QUALITY_LINT", 100),
-            _make_check("QUALITY_TYPE", 100),
-            _make_check("QUALITY_COMPLEXITY", 100),
-            _make_check("QUALITY_SECURITY", 100),
-            _make_check("DEPS_AUDIT", 100),
-            _make_check("QUALITY_COVERAGE", 100),
-            _make_check("ARCH_COUPLING", 100),
-            _make_check("PRACTICE_DOCSTRING", 100),
+            make_check("QUALITY_LINT", 100),
+            make_check("QUALITY_TYPE", 100),
+            make_check("QUALITY_COMPLEXITY", 100),
+            make_check("QUALITY_SECURITY", 100),
+            make_check("DEPS_AUDIT", 100),
+            make_check("QUALITY_COVERAGE", 100),
+            make_check("ARCH_COUPLING", 100),
+            make_check("PRACTICE_DOCSTRING", 100),
         ]
         result = AuditResult(checks=checks)
         # All 100 → total must be 100
@@ -190,16 +160,16 @@ class TestScoringWeights:
         """ARCH_COUPLING score affects the total."""
         # All 100 except architecture = 0
         checks = [
-            _make_check("QUALITY_LINT", 100),
-            _make_check("QUALITY_TYPE", 100),
-            _make_check("QUALITY_COMPLEXITY", 100),
-            _make_check("QUALITY_SECURITY", 100),
-            _make_check("DEPS_AUDIT", 100),
-            _make_check("QUALITY_COVERAGE", 100),
-            _make_check("ARCH_COUPLING", 0),  # 0 * 10% = -10
-            _make_check("PRACTICE_DOCSTRING", 100),
-            _make_check("PRACTICE_BARE_EXCEPT", 100),
-            _make_check("PRACTICE_SECURITY", 100),
+            make_check("QUALITY_LINT", 100),
+            make_check("QUALITY_TYPE", 100),
+            make_check("QUALITY_COMPLEXITY", 100),
+            make_check("QUALITY_SECURITY", 100),
+            make_check("DEPS_AUDIT", 100),
+            make_check("QUALITY_COVERAGE", 100),
+            make_check("ARCH_COUPLING", 0),  # 0 * 10% = -10
+            make_check("PRACTICE_DOCSTRING", 100),
+            make_check("PRACTICE_BARE_EXCEPT", 100),
+            make_check("PRACTICE_SECURITY", 100),
         ]
         result = AuditResult(checks=checks)
         # Missing 10% from architecture
@@ -208,16 +178,16 @@ class TestScoringWeights:
     def test_practices_counts_in_score(self) -> None:
         """PRACTICE_* scores affect the total."""
         checks = [
-            _make_check("QUALITY_LINT", 100),
-            _make_check("QUALITY_TYPE", 100),
-            _make_check("QUALITY_COMPLEXITY", 100),
-            _make_check("QUALITY_SECURITY", 100),
-            _make_check("DEPS_AUDIT", 100),
-            _make_check("QUALITY_COVERAGE", 100),
-            _make_check("ARCH_COUPLING", 100),
-            _make_check("PRACTICE_DOCSTRING", 0),  # avg(0,100,100)=66.7 * 5%
-            _make_check("PRACTICE_BARE_EXCEPT", 100),
-            _make_check("PRACTICE_SECURITY", 100),
+            make_check("QUALITY_LINT", 100),
+            make_check("QUALITY_TYPE", 100),
+            make_check("QUALITY_COMPLEXITY", 100),
+            make_check("QUALITY_SECURITY", 100),
+            make_check("DEPS_AUDIT", 100),
+            make_check("QUALITY_COVERAGE", 100),
+            make_check("ARCH_COUPLING", 100),
+            make_check("PRACTICE_DOCSTRING", 0),  # avg(0,100,100)=66.7 * 5%
+            make_check("PRACTICE_BARE_EXCEPT", 100),
+            make_check("PRACTICE_SECURITY", 100),
         ]
         result = AuditResult(checks=checks)
         # 95% at 100 + 5% at 66.7 = 95 + 3.3 = 98.3
@@ -1,8 +1,12 @@
 """Tests for rich CLI details, improvements section, and legacy removal."""
 
+from functools import cache
+from pathlib import Path
+
 import pytest
 
-from axm_audit.formatters import format_report
+from axm_audit.core.auditor import VALID_CATEGORIES
+from axm_audit.formatters import _category_for, _format_check_details, format_report
 from axm_audit.models.results import AuditResult, CheckResult
 
 # ── _format_check_details tests ──────────────────────────────────────
@@ -13,8 +17,6 @@ class TestFormatCheckDetails:
 
     def test_complexity_top_offenders(self) -> None:
         """Complexity details should list each offending function."""
-        from axm_audit.formatters import _format_check_details
-
         check = CheckResult(
             rule_id="QUALITY_COMPLEXITY",
             passed=False,
@@ -36,8 +38,6 @@ class TestFormatCheckDetails:
 
     def test_security_top_issues(self) -> None:
         """Security details should list each issue with severity."""
-        from axm_audit.formatters import _format_check_details
-
         check = CheckResult(
             rule_id="QUALITY_SECURITY",
             passed=False,
@@ -63,8 +63,6 @@ class TestFormatCheckDetails:
 
     def test_deps_audit_top_vulns(self) -> None:
         """Dependency audit details should list vulnerable packages."""
-        from axm_audit.formatters import _format_check_details
-
         check = CheckResult(
             rule_id="DEPS_AUDIT",
             passed=False,
@@ -84,8 +82,6 @@ class TestFormatCheckDetails:
 
     def test_deps_hygiene_top_issues(self) -> None:
         """Dependency hygiene details should list issues."""
-        from axm_audit.formatters import _format_check_details
-
         check = CheckResult(
             rule_id="DEPS_HYGIENE",
             passed=False,
@@ -105,8 +101,6 @@ class TestFormatCheckDetails:
     def test_details_works_for_passing_checks_with_low_score(self) -> None:
         """_format_check_details should return lines for passing checks
         that have score < 100 (for the improvements section)."""
-        from axm_audit.formatters import _format_check_details
-
         check = CheckResult(
             rule_id="QUALITY_COMPLEXITY",
             passed=True,
@@ -124,8 +118,6 @@ class TestFormatCheckDetails:
 
     def test_score_100_no_details(self) -> None:
         """Passing checks at score=100 should return empty list."""
-        from axm_audit.formatters import _format_check_details
-
         check = CheckResult(
             rule_id="QUALITY_LINT",
             passed=True,
@@ -137,8 +129,6 @@ class TestFormatCheckDetails:
 
     def test_no_details_returns_empty(self) -> None:
         """Checks without details should return empty list."""
-        from axm_audit.formatters import _format_check_details
-
         check = CheckResult(
             rule_id="QUALITY_LINT",
             passed=True,
@@ -305,6 +295,14 @@ class TestFormatReportRichOutput:
         report = format_report(result)
         assert "•" not in report
 
+    def test_category_for_uses_prefix(self) -> None:
+        """_category_for maps the rule_id prefix to a display category."""
+        assert _category_for("STRUCTURE_PYPROJECT") == "structure"
+        assert _category_for("TOOL_RUFF") == "tooling"
+        assert _category_for("DEPS_AUDIT") == "dependencies"
+        assert _category_for("FILE_EXISTS_README.md") == "other"
+        assert _category_for("QUALITYLINT") == "other"
+
 
 # ── Legacy removal tests ────────────────────────────────────────────
 
@@ -312,41 +310,21 @@ class TestFormatReportRichOutput:
 class TestLegacyRemoval:
     """Tests that legacy structure rules are removed."""
 
-    def test_total_rules_count(self) -> None:
+    def test_total_rules_count(self, all_rules) -> None:
         """Should have 17 total rules (was 20, removed 3 structure)."""
-        from axm_audit.core.auditor import get_rules_for_category
-
-        rules = get_rules_for_category(None)
-        assert len(rules) == 18
-
-    def test_no_file_exists_rules(self) -> None:
-        """FILE_EXISTS rules should not be in the rule set."""
-        from axm_audit.core.auditor import get_rules_for_category
-
-        rules = get_rules_for_category(None)
-        rule_ids = [r.rule_id for r in rules]
-        assert not any(rid.startswith("FILE_EXISTS_") for rid in rule_ids)
+        assert len(all_rules) == 18
 
-    def test_no_dir_exists_rules(self) -> None:
-        """DIR_EXISTS rules should not be in the rule set."""
-        from axm_audit.core.auditor import get_rules_for_category
+    @pytest.mark.parametrize("prefix", ["FILE_EXISTS_", "DIR_EXISTS_"])
+    def test_no_legacy_exists_rules(self, all_rule_ids, prefix) -> None:
+        """FILE_EXISTS / DIR_EXISTS rules should not be in the rule set."""
+        assert not any(rid.startswith(prefix) for rid in all_rule_ids)
 
-        rules = get_rules_for_category(None)
-        rule_ids = [r.rule_id for r in rules]
-        assert not any(rid.startswith("DIR_EXISTS_") for rid in rule_ids)
-
-    def test_pyproject_completeness_still_exists(self) -> None:
+    def test_pyproject_completeness_still_exists(self, all_rule_ids) -> None:
         """PyprojectCompletenessRule should still be registered."""
-        from axm_audit.core.auditor import get_rules_for_category
-
-        rules = get_rules_for_category(None)
-        rule_ids = [r.rule_id for r in rules]
-        assert "STRUCTURE_PYPROJECT" in rule_ids
+        assert "STRUCTURE_PYPROJECT" in all_rule_ids
 
     def test_valid_categories_count(self) -> None:
         """Should have 8 valid categories (structure kept for pyproject)."""
-        from axm_audit.core.auditor import VALID_CATEGORIES
-
         assert len(VALID_CATEGORIES) == 8
         assert "structure" in VALID_CATEGORIES
 
@@ -354,6 +332,20 @@ class TestLegacyRemoval:
 # ── Complexity verification tests ────────────────────────────────────
 
 
+_PROJECT_ROOT = Path(__file__).parent.parent
+
+
+@cache
+def _max_cc_by_name(module_path: str) -> dict[str, int]:
+    """Highest cyclomatic complexity per block name, parsed once per file."""
+    from radon.complexity import cc_visit
+
+    cc: dict[str, int] = {}
+    for block in cc_visit((_PROJECT_ROOT / module_path).read_text()):
+        cc[block.name] = max(block.complexity, cc.get(block.name, 0))
+    return cc
+
+
 class TestComplexityAfterRefactoring:
     """Verify refactored functions have cc < 10."""
 
@@ -370,17 +362,6 @@ class TestComplexityAfterRefactoring:
     )
     def test_function_cc_under_10(self, module_path: str, function_name: str) -> None:
         """Each refactored function must have cc < 10."""
-        from pathlib import Path
-
-        from radon.complexity import cc_visit
-
-        project_root = Path(__file__).parent.parent
-        source = (project_root / module_path).read_text()
-        blocks = cc_visit(source)
-
-        for block in blocks:
-            if block.name == function_name:
-                assert block.complexity < 10, (
-                    f"{module_path}:{function_name} has cc={block.complexity}, "
-                    f"expected < 10"
-                )
+        cc = _max_cc_by_name(module_path).get(function_name)
+        assert cc is not None, f"{module_path}:{function_name} not found"
+        assert cc < 10, f"{module_path}:{function_name} has cc={cc}, expected < 10"
@@ -6,6 +6,12 @@ import subprocess
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+# Module imports: a bare TestCoverageRule name would be collected by pytest
+from axm_audit.core.rules import dependencies, quality, security
+from axm_audit.core.rules.base import ProjectRule
+
 # ── Tests for run_in_project helper ──────────────────────────────────
 
 
@@ -28,7 +34,7 @@ class TestRunInProject:
             run_in_project(["ruff", "check", "src"], tmp_path)
 
             args = mock_run.call_args[0][0]
-            assert args[:4] == ["uv", "run", "--directory", str(tmp_path)]
+            assert args[:4] == ["uv", "run", "--directory", tmp_path]
             assert args[4:] == ["ruff", "check", "src"]
 
     def test_without_venv_falls_back_to_bare_cmd(self, tmp_path: Path) -> None:
@@ -43,7 +49,23 @@ class TestRunInProject:
 
             args = mock_run.call_args[0][0]
             assert args == ["ruff", "check", "src"]
-            assert mock_run.call_args[1]["cwd"] == str(tmp_path)
+            assert mock_run.call_args[1]["cwd"] == tmp_path
+
+    def test_venv_lookup_cached_per_project(self, tmp_path: Path) -> None:
+        """The .venv lookup should happen once per project, not per call."""
+        from axm_audit.core.runner import _has_venv, run_in_project
+
+        _has_venv.cache_clear()
+        with patch("axm_audit.core.runner.subprocess.run") as mock_run:
+            mock_run.return_value = subprocess.CompletedProcess(
+                args=[], returncode=0, stdout="", stderr=""
+            )
+            run_in_project(["ruff", "check"], tmp_path)
+            run_in_project(["mypy", "src"], tmp_path)
+
+        info = _has_venv.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
 
     def test_passes_kwargs(self, tmp_path: Path) -> None:
         """Extra kwargs should be forwarded to subprocess.run."""
@@ -66,71 +88,35 @@ class TestRunInProject:
 class TestRulesUseRunInProject:
     """Verify all rules use run_in_project instead of direct subprocess."""
 
-    def test_linting_uses_run_in_project(self, tmp_path: Path) -> None:
-        """LintingRule should call run_in_project."""
-        from axm_audit.core.rules.quality import LintingRule
-
-        (tmp_path / "src").mkdir()
-
-        with patch("axm_audit.core.rules.quality.run_in_project") as mock:
-            mock.return_value = MagicMock(stdout="[]", stderr="", returncode=0)
-            LintingRule().check(tmp_path)
-            mock.assert_called_once()
-            assert mock.call_args[0][0][0] == "ruff"
-
-    def test_typecheck_uses_run_in_project(self, tmp_path: Path) -> None:
-        """TypeCheckRule should call run_in_project."""
-        from axm_audit.core.rules.quality import TypeCheckRule
-
-        (tmp_path / "src").mkdir()
-
-        with patch("axm_audit.core.rules.quality.run_in_project") as mock:
-            mock.return_value = MagicMock(stdout="", stderr="", returncode=0)
-            TypeCheckRule().check(tmp_path)
+    @pytest.mark.parametrize(
+        ("rule_cls", "tool", "needs_src", "stdout"),
+        [
+            (quality.LintingRule, "ruff", True, "[]"),
+            (quality.TypeCheckRule, "mypy", True, ""),
+            (quality.TestCoverageRule, "pytest", False, ""),
+            (dependencies.DependencyAuditRule, "pip-audit", False, "{}"),
+            (dependencies.DependencyHygieneRule, "deptry", False, "[]"),
+            (security.SecurityRule, "bandit", True, "{}"),
+        ],
+        ids=lambda v: v.__name__ if isinstance(v, type) else None,
+    )
+    def test_rule_uses_run_in_project(
+        self,
+        tmp_path: Path,
+        rule_cls: type[ProjectRule],
+        tool: str,
+        needs_src: bool,
+        stdout: str,
+    ) -> None:
+        """Each tool rule should shell out through run_in_project."""
+        if needs_src:
+            (tmp_path / "src").mkdir()
+
+        with patch(f"{rule_cls.__module__}.run_in_project") as mock:
+            mock.return_value = MagicMock(stdout=stdout, stderr="", returncode=0)
+            rule_cls().check(tmp_path)
             mock.assert_called_once()
-            assert mock.call_args[0][0][0] == "mypy"
-
-    def test_coverage_uses_run_in_project(self, tmp_path: Path) -> None:
-        """TestCoverageRule should call run_in_project."""
-        from axm_audit.core.rules.quality import TestCoverageRule
-
-        with patch("axm_audit.core.rules.quality.run_in_project") as mock:
-            mock.return_value = MagicMock(stdout="", stderr="", returncode=0)
-            TestCoverageRule().check(tmp_path)
-            mock.assert_called_once()
-            assert mock.call_args[0][0][0] == "pytest"
-
-    def test_pip_audit_uses_run_in_project(self, tmp_path: Path) -> None:
-        """DependencyAuditRule should call run_in_project."""
-        from axm_audit.core.rules.dependencies import DependencyAuditRule
-
-        with patch("axm_audit.core.rules.dependencies.run_in_project") as mock:
-            mock.return_value = MagicMock(stdout="{}", stderr="", returncode=0)
-            DependencyAuditRule().check(tmp_path)
-            mock.assert_called_once()
-            assert mock.call_args[0][0][0] == "pip-audit"
-
-    def test_deptry_uses_run_in_project(self, tmp_path: Path) -> None:
-        """DependencyHygieneRule should call run_in_project."""
-        from axm_audit.core.rules.dependencies import DependencyHygieneRule
-
-        with patch("axm_audit.core.rules.dependencies.run_in_project") as mock:
-            mock.return_value = MagicMock(stdout="[]", stderr="", returncode=0)
-            DependencyHygieneRule().check(tmp_path)
-            mock.assert_called_once()
-            assert mock.call_args[0][0][0] == "deptry"
-
-    def test_bandit_uses_run_in_project(self, tmp_path: Path) -> None:
-        """SecurityRule should call run_in_project."""
-        from axm_audit.core.rules.security import SecurityRule
-
-        (tmp_path / "src").mkdir()
-
-        with patch("axm_audit.core.rules.security.run_in_project") as mock:
-            mock.return_value = MagicMock(stdout="{}", stderr="", returncode=0)
-            SecurityRule().check(tmp_path)
-            mock.assert_called_once()
-            assert mock.call_args[0][0][0] == "bandit"
+            assert mock.call_args[0][0][0] == tool
 
 
 # ── Grep test: no sys.executable in rules ────────────────────────────
@@ -142,8 +128,9 @@ class TestNoSysExecutable:
     def test_no_sys_executable_in_rules(self) -> None:
         """Rule files should not reference sys.executable."""
         rules_dir = Path("src/axm_audit/core/rules")
-        for py_file in rules_dir.glob("*.py"):
-            content = py_file.read_text()
-            assert "sys.executable" not in content, (
-                f"{py_file.name} still uses sys.executable"
-            )
+        offenders = [
+            p.name
+            for p in rules_dir.glob("*.py")
+            if b"sys.executable" in p.read_bytes()
+        ]
+        assert not offenders, f"still using sys.executable: {offenders}"
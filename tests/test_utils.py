@@ -0,0 +1,22 @@
+"""Tests for shared utilities."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from axm_audit.utils import encode_json
+from tests.helpers import FakeOrjson
+
+
+@pytest.mark.parametrize("indent", [None, 2, 4])
+def test_encode_json_same_payload_any_backend(
+    json_backend: FakeOrjson | None, indent: int | None
+) -> None:
+    """Non-string keys and non-JSON values encode with or without orjson."""
+    payload = {1: "one", "path": Path("src/a.py")}
+
+    assert json.loads(encode_json(payload, indent=indent)) == {
+        "1": "one",
+        "path": "src/a.py",
+    }